@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import pytz
 from config import CALENDAR_CONFIG
+from interval_index import IntervalIndex
 
 class CalendarService:
     def __init__(self, config: Dict = None):
@@ -33,23 +34,33 @@ class CalendarService:
         if end_dt.tzinfo is None:
             end_dt = self.timezone.localize(end_dt)
         
+        # Index each participant's events once instead of rescanning them per slot
+        participant_indexes = []
+        if existing_events:
+            participant_indexes = [
+                self._build_event_index(existing_events[participant])
+                for participant in participants if participant in existing_events
+            ]
+        
         available_slots = []
         current_time = start_dt
+        duration = timedelta(minutes=duration_minutes)
+        step = timedelta(minutes=15)
+        last_start = end_dt - duration
+        # Conflict checks run on epoch seconds, advanced in step with current_time
+        start_epoch = int(start_dt.timestamp())
+        duration_secs = int(duration.total_seconds())
+        step_secs = int(step.total_seconds())
         
         # Generate 15-minute time slots
-        while current_time + timedelta(minutes=duration_minutes) <= end_dt:
-            slot_end = current_time + timedelta(minutes=duration_minutes)
+        while current_time <= last_start:
+            slot_end = current_time + duration
             
             # Check if slot is within business hours
             if self._is_business_hours(current_time):
                 
                 # Check conflicts for all participants
-                has_conflict = False
-                if existing_events:
-                    for participant in participants:
-                        if self._has_participant_conflict(participant, current_time, slot_end, existing_events):
-                            has_conflict = True
-                            break
+                has_conflict = any(index.overlaps(start_epoch, start_epoch + duration_secs) for index in participant_indexes)
                 
                 if not has_conflict:
                     available_slots.append({
@@ -59,7 +70,8 @@ class CalendarService:
                         'participants': participants.copy()
                     })
             
-            current_time += timedelta(minutes=15)
+            current_time += step
+            start_epoch += step_secs
         
         return available_slots
     
@@ -72,32 +84,15 @@ class CalendarService:
         hour = dt.hour
         return 9 <= hour < 18
     
-    def _has_participant_conflict(self, 
-                                participant: str, 
-                                start_time: datetime, 
-                                end_time: datetime,
-                                existing_events: Dict[str, List[Dict]]) -> bool:
-        """Check if participant has conflicts in the given time slot"""
-        
-        if participant not in existing_events:
-            return False
-        
-        participant_events = existing_events[participant]
-        
-        for event in participant_events:
-            event_start = datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00'))
-            event_end = datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00'))
-            
-            # Convert to same timezone
-            if event_start.tzinfo != start_time.tzinfo:
-                event_start = event_start.astimezone(start_time.tzinfo)
-                event_end = event_end.astimezone(start_time.tzinfo)
-            
-            # Check for overlap
-            if not (end_time <= event_start or start_time >= event_end):
-                return True
-        
-        return False
+    def _build_event_index(self, events: List[Dict]) -> IntervalIndex:
+        """Parse a participant's events once into an interval index over epoch seconds"""
+        # Offsets are parsed from the timestamps themselves, so any timezone compares correctly
+        return IntervalIndex(
+            (int(datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00')).timestamp()),
+             int(datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00')).timestamp()),
+             event)
+            for event in events
+        )
     
     def create_calendar_event(self, event_data: Dict) -> Dict:
         """Create a calendar event (mock implementation)"""
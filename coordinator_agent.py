@@ -12,6 +12,36 @@ from mock_data import USER_PREFERENCES
 from metadata_framework import record_coordinator, record_request, get_business_metadata
 
 
+# Mock events for demo - in real system this would come from calendar API
+_MOCK_CALENDARS = {
+    "usertwo.amd@gmail.com": [
+        {
+            "StartTime": "2025-07-17T10:00:00+05:30",
+            "EndTime": "2025-07-17T10:30:00+05:30",
+            "NumAttendees": 3,
+            "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com", "userthree.amd@gmail.com"],
+            "Summary": "Team Meet"
+        }
+    ],
+    "userthree.amd@gmail.com": [
+        {
+            "StartTime": "2025-07-17T10:00:00+05:30",
+            "EndTime": "2025-07-17T10:30:00+05:30",
+            "NumAttendees": 3,
+            "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com", "userthree.amd@gmail.com"],
+            "Summary": "Team Meet"
+        },
+        {
+            "StartTime": "2025-07-17T13:00:00+05:30",
+            "EndTime": "2025-07-17T14:00:00+05:30",
+            "NumAttendees": 1,
+            "Attendees": ["SELF"],
+            "Summary": "Lunch with Customers"
+        }
+    ]
+}
+
+
 class CoordinatorAgent:
     def __init__(self, llm_client=None):
         self.llm = llm_client or LLMService()
@@ -74,36 +104,7 @@ class CoordinatorAgent:
     
     def _get_mock_events_for_user(self, email: str) -> List[Dict]:
         """Get mock calendar events for a user"""
-        # Mock events for demo - in real system this would come from calendar API
-        mock_calendars = {
-            "usertwo.amd@gmail.com": [
-                {
-                    "StartTime": "2025-07-17T10:00:00+05:30",
-                    "EndTime": "2025-07-17T10:30:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com", "userthree.amd@gmail.com"],
-                    "Summary": "Team Meet"
-                }
-            ],
-            "userthree.amd@gmail.com": [
-                {
-                    "StartTime": "2025-07-17T10:00:00+05:30",
-                    "EndTime": "2025-07-17T10:30:00+05:30",
-                    "NumAttendees": 3,
-                    "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com", "userthree.amd@gmail.com"],
-                    "Summary": "Team Meet"
-                },
-                {
-                    "StartTime": "2025-07-17T13:00:00+05:30",
-                    "EndTime": "2025-07-17T14:00:00+05:30",
-                    "NumAttendees": 1,
-                    "Attendees": ["SELF"],
-                    "Summary": "Lunch with Customers"
-                }
-            ]
-        }
-        
-        return mock_calendars.get(email, [])
+        return list(_MOCK_CALENDARS.get(email, ()))
     
     def create_participant_agents(self, attendees_data: List[Dict]) -> List[ParticipantAgent]:
         """Create participant agents from attendee data"""
@@ -283,8 +283,8 @@ The narrative should read like a sophisticated AI assistant explaining its sched
                 timezone = get_timezone_for_email(attendee.email)
                 participant_timezones[attendee.email] = timezone
             
-            # Convert meeting time to all timezones
-            timezone_times = convert_time_across_timezones(
+            # Convert meeting time to all timezones (plain function, not the agent Tool wrapper)
+            timezone_times = convert_time_across_timezones.function(
                 result.scheduled_slot.start_time,
                 list(set(participant_timezones.values()))
             )
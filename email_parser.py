@@ -1,4 +1,6 @@
+import asyncio
 import re
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 import pytz
@@ -48,6 +50,10 @@ class EmailParser:
         # Fallback to regex parsing
         return self._parse_with_regex(email_content)
     
+    async def parse_email_async(self, email_content: str) -> Dict:
+        """Async version of parse_email that keeps the blocking LLM call off the event loop"""
+        return await asyncio.to_thread(self.parse_email, email_content)
+    
     def _parse_with_llm(self, email_content: str) -> Optional[Dict]:
         """Use LLM to parse email content"""
         try:
@@ -68,8 +74,7 @@ class EmailParser:
             response = self.llm_service.generate(prompt)
             
             # Parse LLM response (assumes JSON format)
-            import json
-            return json.loads(response)
+            return orjson.loads(response)
             
         except Exception as e:
             print(f"LLM parsing failed: {e}")
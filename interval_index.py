@@ -0,0 +1,38 @@
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Iterable, List, Tuple
+
+
+class IntervalIndex:
+    """Static index of [start, end) intervals answering overlap queries in O(log N + k)"""
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, Any]]):
+        # (start, end, payload) sorted by start; any mutually comparable start/end values work
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [start for start, _, _ in ordered]
+        self.ends = [end for _, end, _ in ordered]
+        self.payloads = [payload for _, _, payload in ordered]
+        # Latest end among the first i+1 intervals, so one lookup answers "does any overlap?"
+        self.running_max_end = list(accumulate(self.ends, max))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlaps(self, start, end) -> bool:
+        """Check if any interval overlaps [start, end)"""
+        # Only intervals starting before `end` can overlap; of those, one does
+        # iff the latest end reaches past `start`
+        idx = bisect_left(self.starts, end)
+        return idx > 0 and self.running_max_end[idx - 1] > start
+
+    def overlapping(self, start, end) -> List[Any]:
+        """Payloads of all intervals overlapping [start, end), ordered by start"""
+        idx = bisect_left(self.starts, end)
+        matches = []
+        # Walk back until no earlier interval can still reach past `start`
+        while idx > 0 and self.running_max_end[idx - 1] > start:
+            idx -= 1
+            if self.ends[idx] > start:
+                matches.append(self.payloads[idx])
+        matches.reverse()
+        return matches
@@ -1,8 +1,23 @@
 import json
+import re
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import pytz
 
+# Required fields in reporting order, plus set views for one-shot "anything missing?" diffs
+_REQUEST_FIELDS = ('Request_id', 'Datetime', 'Location', 'From', 'Attendees', 'Subject', 'EmailContent')
+_RESPONSE_FIELDS = (
+    'Request_id', 'Datetime', 'Location', 'From', 'Attendees',
+    'Subject', 'EmailContent', 'EventStart', 'EventEnd', 'Duration_mins', 'MetaData'
+)
+_REQUEST_FIELD_SET = frozenset(_REQUEST_FIELDS)
+_RESPONSE_FIELD_SET = frozenset(_RESPONSE_FIELDS)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Day-first timestamps (DD-MM-YYYYT..., the request Datetime format) can never parse as ISO
+_DAY_FIRST_RE = re.compile(r'\d{2}-\d{2}-\d{4}T')
+
 class JSONValidator:
     def __init__(self):
         self.errors = []
@@ -18,15 +33,14 @@ class JSONValidator:
             self.errors.append("Request must be a valid JSON object")
             return self._create_validation_result()
         
-        # Required fields for new format
-        required_fields = ['Request_id', 'Datetime', 'Location', 'From', 'Attendees', 'Subject', 'EmailContent']
-        
-        # Validate required fields
-        for field in required_fields:
-            if field not in data:
-                self.errors.append(f"Missing required field: {field}")
-            elif data[field] is None or data[field] == "":
-                self.errors.append(f"Required field cannot be empty: {field}")
+        # Validate required fields; only walk them in order when something is missing or empty
+        missing = _REQUEST_FIELD_SET - data.keys()
+        if missing or any(data[field] is None or data[field] == "" for field in _REQUEST_FIELDS):
+            for field in _REQUEST_FIELDS:
+                if field in missing:
+                    self.errors.append(f"Missing required field: {field}")
+                elif data[field] is None or data[field] == "":
+                    self.errors.append(f"Required field cannot be empty: {field}")
         
         # Validate field types
         self._validate_field_types(data)
@@ -44,15 +58,11 @@ class JSONValidator:
         self.errors = []
         self.warnings = []
         
-        # Required response fields for new format
-        required_response_fields = [
-            'Request_id', 'Datetime', 'Location', 'From', 'Attendees', 
-            'Subject', 'EmailContent', 'EventStart', 'EventEnd', 'Duration_mins', 'MetaData'
-        ]
-        
-        for field in required_response_fields:
-            if field not in data:
-                self.errors.append(f"Missing required response field: {field}")
+        missing = _RESPONSE_FIELD_SET - data.keys()
+        if missing:
+            self.errors.extend(
+                f"Missing required response field: {field}" for field in _RESPONSE_FIELDS if field in missing
+            )
         
         # Validate EventStart and EventEnd if present
         if 'EventStart' in data and data['EventStart']:
@@ -165,9 +175,7 @@ class JSONValidator:
     
     def _is_valid_email(self, email: str) -> bool:
         """Basic email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
     
     def _is_valid_datetime(self, dt_str: str) -> bool:
         """Validate datetime string format"""
@@ -176,15 +184,19 @@ class JSONValidator:
             if dt_str.endswith('Z'):
                 dt_str = dt_str.replace('Z', '+00:00')
             
-            datetime.fromisoformat(dt_str)
+            # Skip the doomed ISO attempt (and its exception) for day-first strings
+            if not _DAY_FIRST_RE.match(dt_str):
+                datetime.fromisoformat(dt_str)
+                return True
+        except (ValueError, TypeError):
+            pass
+        
+        try:
+            # Try alternative format DD-MM-YYYYTHH:MM:SS
+            datetime.strptime(dt_str, '%d-%m-%YT%H:%M:%S')
             return True
         except (ValueError, TypeError):
-            try:
-                # Try alternative format DD-MM-YYYYTHH:MM:SS
-                datetime.strptime(dt_str, '%d-%m-%YT%H:%M:%S')
-                return True
-            except (ValueError, TypeError):
-                return False
+            return False
     
     def _create_validation_result(self) -> Dict[str, Any]:
         """Create validation result"""
@@ -1,8 +1,100 @@
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import aiohttp
+import orjson
 import requests
 import json
 from typing import Dict, List, Optional
 import time
 
+# Cap on in-flight LLM requests; match vLLM's --max-num-seqs. Process-wide, since every
+# Flask request thread runs its own event loop
+_LLM_MAX_INFLIGHT = int(os.getenv('VLLM_MAX_INFLIGHT', '16'))
+_llm_slots = threading.BoundedSemaphore(_LLM_MAX_INFLIGHT)
+
+
+class _SlotWaiter:
+    """Blocking wait for an LLM slot that hands the slot back if its waiter gave up"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._abandoned = False
+        self._held = False
+    
+    def acquire(self):
+        """Block until a slot is free (runs in a worker thread)"""
+        _llm_slots.acquire()
+        with self._lock:
+            if self._abandoned:
+                _llm_slots.release()
+            else:
+                self._held = True
+    
+    def abandon(self) -> bool:
+        """Stop waiting; True if a slot was already taken and the caller must release it"""
+        with self._lock:
+            self._abandoned = True
+            return self._held
+
+
+@asynccontextmanager
+async def llm_semaphore():
+    """Hold one of the process-wide LLM request slots"""
+    if not _llm_slots.acquire(blocking=False):
+        # Wait in a worker thread so this loop keeps serving its other tasks
+        waiter = _SlotWaiter()
+        try:
+            await asyncio.to_thread(waiter.acquire)
+        except BaseException:
+            if waiter.abandon():
+                _llm_slots.release()
+            raise
+    try:
+        yield
+    finally:
+        _llm_slots.release()
+
+
+# LRU of successful LLM responses, keyed by prompt digest or a caller-supplied key
+_RESPONSE_CACHE_SIZE = 1024
+_response_cache = OrderedDict()
+# Shared by the per-request event loops of concurrent Flask threads
+_response_cache_lock = threading.Lock()
+
+
+def _prompt_digest(prompt: str, system_prompt: str, max_tokens: int) -> bytes:
+    """Stable cache key for a generation request"""
+    return hashlib.blake2b(f"{max_tokens}\0{system_prompt or ''}\0{prompt}".encode(), digest_size=16).digest()
+
+
+# Keep-alive session for the blocking vLLM path (requests.Session pools connections per host)
+_requests_session = requests.Session()
+
+
+# Keep-alive HTTP sessions shared by every LLMService on a loop, open only inside pooled_http_session()
+_http_sessions = {}
+
+
+@asynccontextmanager
+async def pooled_http_session():
+    """Share one keep-alive aiohttp session across the LLM calls made inside this block"""
+    loop = asyncio.get_running_loop()
+    if loop in _http_sessions:
+        yield
+        return
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=16)
+    session = _http_sessions[loop] = aiohttp.ClientSession(connector=connector)
+    try:
+        yield
+    finally:
+        del _http_sessions[loop]
+        await session.close()
+
+
 class LLMService:
     def __init__(self, config: Dict = None):
         self.config = config or {}
@@ -23,20 +115,22 @@ class LLMService:
             return self._call_vllm(prompt, system_prompt, max_tokens)
         except Exception as e:
             print(f"vLLM call failed: {e}")
-            
-            # Fallback to OpenAI if configured
-            if self.config.get('openai_api_key'):
-                try:
-                    return self._call_openai(prompt, system_prompt, max_tokens)
-                except Exception as e2:
-                    print(f"OpenAI fallback failed: {e2}")
-            
-            # Final fallback to mock response
-            print("Using mock LLM response")
-            return self._mock_response(prompt)
+            return self._generate_fallback(prompt, system_prompt, max_tokens)
     
-    def _call_vllm(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
-        """Call local vLLM service"""
+    def _generate_fallback(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
+        """OpenAI (if configured), then mock response, after a failed vLLM call"""
+        if self.config.get('openai_api_key'):
+            try:
+                return self._call_openai(prompt, system_prompt, max_tokens)
+            except Exception as e2:
+                print(f"OpenAI fallback failed: {e2}")
+        
+        # Final fallback to mock response
+        print("Using mock LLM response")
+        return self._mock_response(prompt)
+    
+    def _vllm_payload(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> Dict:
+        """Build the vLLM completions request body"""
         
         # Format prompt for Mixtral
         if system_prompt:
@@ -44,7 +138,7 @@ class LLMService:
         else:
             formatted_prompt = f"<s>[INST] {prompt} [/INST]"
         
-        payload = {
+        return {
             "model": self.model_name,
             "prompt": formatted_prompt,
             "max_tokens": max_tokens,
@@ -52,16 +146,45 @@ class LLMService:
             "top_p": 0.9,
             "stop": ["</s>", "[INST]", "[/INST]"]
         }
+    
+    def _call_vllm(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
+        """Call local vLLM service"""
+        payload = self._vllm_payload(prompt, system_prompt, max_tokens)
         
-        response = requests.post(
+        response = _requests_session.post(
             f"{self.base_url}/v1/completions",
-            json=payload,
+            data=orjson.dumps(payload),
             timeout=self.timeout,
             headers={"Content-Type": "application/json"}
         )
         
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
+        
+        return result['choices'][0]['text'].strip()
+    
+    async def _call_vllm_async(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
+        """Call local vLLM service, over the pooled session when one is open"""
+        session = _http_sessions.get(asyncio.get_running_loop())
+        if session is None:
+            # Outside pooled_http_session(): a one-off session, closed right after the call
+            async with aiohttp.ClientSession() as session:
+                return await self._post_completion(session, prompt, system_prompt, max_tokens)
+        return await self._post_completion(session, prompt, system_prompt, max_tokens)
+    
+    async def _post_completion(self, session: aiohttp.ClientSession, prompt: str,
+                               system_prompt: str = None, max_tokens: int = 512) -> str:
+        """POST one completions request on the given session"""
+        payload = self._vllm_payload(prompt, system_prompt, max_tokens)
+        
+        async with session.post(
+            f"{self.base_url}/v1/completions",
+            data=orjson.dumps(payload),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            result = orjson.loads(await response.read())
         
         return result['choices'][0]['text'].strip()
     
@@ -123,19 +246,42 @@ class LLMService:
         else:
             return "I understand your request and will process it accordingly."
     
-    async def generate_async(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
-        """Async version of generate"""
-        import asyncio
-        
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, 
-            self.generate, 
-            prompt, 
-            system_prompt, 
-            max_tokens
-        )
+    async def generate_async(self, prompt: str, system_prompt: str = None, max_tokens: int = 512,
+                             cache_key=None) -> str:
+        """Async version of generate; pass cache_key to share responses across equivalent prompts"""
+        if self.use_mock:
+            return self._mock_response(prompt)
+        
+        if cache_key is None:
+            cache_key = _prompt_digest(prompt, system_prompt, max_tokens)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+        if cached is not None:
+            return cached
+        
+        async with llm_semaphore():
+            try:
+                response = await self._call_vllm_async(prompt, system_prompt, max_tokens)
+                with _response_cache_lock:
+                    _response_cache[cache_key] = response
+                    _response_cache.move_to_end(cache_key)
+                    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                        _response_cache.popitem(last=False)
+                return response
+            except Exception as e:
+                print(f"vLLM call failed: {e}")
+            
+            # The OpenAI client is blocking; run it in the thread pool
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, 
+                self._generate_fallback, 
+                prompt, 
+                system_prompt, 
+                max_tokens
+            )
     
     def batch_generate(self, prompts: List[str], system_prompt: str = None, max_tokens: int = 512) -> List[str]:
         """Generate responses for multiple prompts"""
@@ -208,7 +354,8 @@ class MockLLMService:
         else:
             return f"Mock response {self.call_count}: I understand and will process this request."
     
-    async def generate_async(self, prompt: str, system_prompt: str = None, max_tokens: int = 512) -> str:
+    async def generate_async(self, prompt: str, system_prompt: str = None, max_tokens: int = 512,
+                             cache_key=None) -> str:
         return self.generate(prompt, system_prompt, max_tokens)
     
     def health_check(self) -> Dict:
@@ -3,17 +3,72 @@
 
 from flask import Flask, request, jsonify
 import asyncio
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from config import LOGGING_CONFIG
 from json_validator import sanitize_json_request
+from llm_service import pooled_http_session
 from metadata_framework import get_business_metadata, reset_business_metadata
 
 
 
 from coordinator_agent import CoordinatorAgent
+
+# Agent progress messages are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+logging.basicConfig(level=LOGGING_CONFIG['level'], format=LOGGING_CONFIG['format'])
+
 app = Flask(__name__)
 
 coordinator = CoordinatorAgent()
 
+# Successful responses by the fields that decide the schedule, so reruns of the same
+# meeting request skip the agent pipeline (and its LLM calls) entirely
+_RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', '300'))
+_RESPONSE_CACHE_SIZE = 256
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+def _request_cache_key(data):
+    """Hash of sender, date, subject, email body and the attendee list"""
+    # Attendee order is kept: the response lists attendees (and the new event's) in request order
+    attendees = ','.join(
+        str(attendee.get('email', '')) for attendee in data.get('Attendees') or [] if isinstance(attendee, dict)
+    )
+    raw = f"{data.get('From')}|{data.get('Datetime')}|{data.get('Subject')}|{data.get('EmailContent')}|{attendees}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+def _cached_response(key):
+    """Copy of a fresh cached response, or None"""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > _RESPONSE_CACHE_TTL:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+    return copy.deepcopy(response)
+
+def _store_response(key, response):
+    """Remember a successful response, evicting the least recently used"""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), copy.deepcopy(response))
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+async def schedule_meeting(data):
+    """Run one scheduling request with its LLM calls sharing pooled connections"""
+    async with pooled_http_session():
+        return await coordinator.schedule_meeting(data)
+
 @app.route('/receive', methods=['POST'])
 def receive():
     """Required endpoint with business-friendly metadata"""
@@ -35,8 +90,17 @@ def receive():
         # Sanitize input
         sanitized_data = sanitize_json_request(data)
         
+        cache_key = _request_cache_key(sanitized_data)
+        cached = _cached_response(cache_key)
+        if cached is not None:
+            # Same meeting already scheduled; only the per-request echo fields differ
+            cached['Request_id'] = sanitized_data['Request_id']
+            cached['Location'] = sanitized_data.get('Location')
+            print(f"Served from response cache: {cached['EventStart']} to {cached['EventEnd']}")
+            return jsonify(cached)
+        
         # Process with multi-agent system
-        result = asyncio.run(coordinator.schedule_meeting(sanitized_data))
+        result = asyncio.run(schedule_meeting(sanitized_data))
         
         # Generate business-friendly summary as clean array
         business_summary_lines = get_business_metadata().generate_business_summary()
@@ -52,6 +116,7 @@ def receive():
         
         if success:
             print(f"Scheduled: {result['EventStart']} to {result['EventEnd']}")
+            _store_response(cache_key, result)
         
         return jsonify(result)
         
@@ -4,11 +4,15 @@ Business-Friendly Metadata Framework for AMD AI Scheduler
 Generates clear, readable summaries for business stakeholders
 """
 
+import os
 import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+# Set METADATA_RECORDING=false to skip building agent reasoning records (e.g. load tests)
+RECORDING_ENABLED = os.getenv('METADATA_RECORDING', 'True').lower() == 'true'
+
 class BusinessMetadata:
     """Collects and formats agent activities in business-friendly language"""
     
@@ -296,24 +300,36 @@ def reset_business_metadata():
 # Helper functions for easy integration
 def record_request(request_data: Dict):
     """Record initial request"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_initial_request(request_data)
 
 def record_coordinator(action: str, outcome: str, reasoning: str):
     """Record coordinator activity"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_coordinator_activity(action, outcome, reasoning)
 
 def record_negotiator(action: str, outcome: str, reasoning: str):
     """Record negotiator activity"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_negotiator_activity(action, outcome, reasoning)
 
 def record_participant(participant_id: str, decision: str, reasoning: str, conflict_details: str = None):
     """Record participant response"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_participant_response(participant_id, decision, reasoning, conflict_details)
 
 def record_slots(slots: List[Dict], analysis: Dict = None):
     """Record available slots"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_available_slots(slots, analysis)
 
 def record_selection(selected_slot: Dict, reasoning: str):
     """Record final selection"""
+    if not RECORDING_ENABLED:
+        return
     get_business_metadata().record_final_selection(selected_slot, reasoning)
\ No newline at end of file
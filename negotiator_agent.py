@@ -1,14 +1,88 @@
 import asyncio
+import functools
+import heapq
+import logging
+import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from collections import Counter
+from dataclasses import dataclass
+from statistics import fmean
 from llm_service import LLMService
 from email_parser import EmailParser
 import pytz
-from metadata_framework import record_negotiator, record_slots, record_selection
+from metadata_framework import RECORDING_ENABLED, record_negotiator, record_slots, record_selection
+
+logger = logging.getLogger(__name__)
+
+# Timezone fairness score by local start hour: 9-17 optimal, then 8/18, 7/19, else poor.
+# Shared with the pydantic-ai negotiator so both score fairness identically
+HOUR_SCORE = [0.2] * 24
+for _hour in (7, 19):
+    HOUR_SCORE[_hour] = 0.6
+for _hour in (8, 18):
+    HOUR_SCORE[_hour] = 0.8
+for _hour in range(9, 18):
+    HOUR_SCORE[_hour] = 1.0
+del _hour
+
+# First standalone number in an LLM selection response
+_LLM_NUM_RE = re.compile(r'\b\d+\b')
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD target date (cached, the same date repeats within a negotiation)"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def _to_epoch(iso_time: str) -> int:
+    """Convert an ISO timestamp to integer epoch seconds for slot identity"""
+    return int(datetime.fromisoformat(iso_time).timestamp())
+
+
+@dataclass(slots=True)
+class ScoredSlot:
+    """Ranked alternative slot used internally during negotiation"""
+    start_time: str
+    end_time: str
+    start_epoch: int
+    end_epoch: int
+    consensus_score: float
+    timezone_fairness: float
+    overall_score: float
+    time_display: str
+    start_dt: datetime
+    display_12h: str
+    
+    @property
+    def hour(self) -> int:
+        return self.start_dt.hour
+    
+    def to_dict(self) -> Dict:
+        """Serialize to the alternative slot format returned to callers"""
+        return {
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'overall_score': self.overall_score,
+            'time_display': self.time_display
+        }
 
 
 class NegotiatorAgent:
+    # (minimum consensus score, phrase), checked in order
+    _CONSENSUS_PHRASES = (
+        (0.8, "it achieved excellent agreement among all participants"),
+        (0.6, "it provided good balance of everyone's preferences"),
+        (float('-inf'), "it was the best available compromise"),
+    )
+    
+    # Start hour -> timing benefit mentioned in the selection reasoning
+    _HOUR_PHRASES = {
+        **dict.fromkeys((9, 10, 11), "morning timing works well for focus and energy levels"),
+        **dict.fromkeys((13, 14, 15), "early afternoon timing avoids lunch conflicts"),
+    }
+    
     def __init__(self, llm_client=None):
         self.llm = llm_client or LLMService()
         self.email_parser = EmailParser(llm_client)
@@ -22,12 +96,12 @@ class NegotiatorAgent:
         email_content = meeting_request.get('EmailContent', '')
         
         # Parse email content for user preferences
-        parsed_email = self.email_parser.parse_email(email_content)
+        parsed_email = await self.email_parser.parse_email_async(email_content)
         target_date = parsed_email.get('suggested_date', self._get_default_date())
         requested_time = self._build_requested_time(parsed_email, target_date, duration_mins)
         
-        print(f"Negotiating meeting for {len(participants)} participants")
-        print(f"Target date: {target_date}, Duration: {duration_mins} minutes")
+        logger.debug("Negotiating meeting for %d participants", len(participants))
+        logger.debug("Target date: %s, Duration: %s minutes", target_date, duration_mins)
         
         # Check if user requested specific time
         if requested_time and requested_time.get('start'):
@@ -39,7 +113,7 @@ class NegotiatorAgent:
                 reasoning=f"User specifically asked for {requested_time_display}, so checking if this works for everyone first"
             )
             
-            print("Evaluating specifically requested time...")
+            logger.debug("Evaluating specifically requested time...")
             initial_result = await self._evaluate_specific_time(participants, requested_time, duration_mins)
             
             if initial_result['success']:
@@ -61,20 +135,20 @@ class NegotiatorAgent:
                     reasoning=f"Selected {requested_time_display} because it was specifically requested by the user and works perfectly for all {len(participants)} participants. No conflicts found and achieved good consensus among the team."
                 )
                 
-                print("Requested time works for everyone!")
+                logger.debug("Requested time works for everyone!")
                 return self._create_success_response(initial_result, meeting_request, [])
                 
             else:
                 conflicts = initial_result['conflicts']
-                conflict_participants = [c['participant'].split('@')[0].title() for c in conflicts]
                 
+                conflict_participants = [c['participant'].split('@')[0].title() for c in conflicts]
                 record_negotiator(
                     action="analyze requested time conflicts",
                     outcome=f"conflicts found with {len(conflicts)} participants: {', '.join(conflict_participants)}",
                     reasoning=f"User's preferred {requested_time_display} doesn't work because of existing commitments"
                 )
                 
-                print(f"Requested time has {len(conflicts)} conflicts")
+                logger.debug("Requested time has %d conflicts", len(conflicts))
         
         # Find alternative slots
         record_negotiator(
@@ -83,7 +157,7 @@ class NegotiatorAgent:
             reasoning="Since requested time has conflicts, need to find alternative times that work better for everyone"
         )
         
-        print("Finding alternative time slots...")
+        logger.debug("Finding alternative time slots...")
         alternative_slots = await self._find_alternative_slots(participants, target_date, duration_mins)
         
         if not alternative_slots:
@@ -93,35 +167,36 @@ class NegotiatorAgent:
                 reasoning="Exhaustive analysis of the target date found no times where all participants are available"
             )
             
-            print("No alternative slots found")
+            logger.debug("No alternative slots found")
             return self._create_failure_response(meeting_request, "No available slots found")
         
-        # Analyze each slot for business summary
-        business_slots = []
-        for slot in alternative_slots:
-            slot_time = datetime.fromisoformat(slot['start_time']).strftime('%I:%M %p')
-            attendee_count = len(participants)  # Assume all can attend if in alternatives
+        if RECORDING_ENABLED:
+            # Analyze each slot for business summary
+            business_slots = []
+            for slot in alternative_slots:
+                slot_time = slot.display_12h
+                attendee_count = len(participants)  # Assume all can attend if in alternatives
+                
+                # Create business-friendly slot info
+                business_slot = {
+                    'time_display': slot_time,
+                    'start_time': slot.start_time,
+                    'end_time': slot.end_time,
+                    'attendee_count': attendee_count,
+                    'total_participants': len(participants),
+                    'overall_score': slot.overall_score,
+                    'conflicts': []  # Will be populated if needed
+                }
+                business_slots.append(business_slot)
             
-            # Create business-friendly slot info
-            business_slot = {
-                'time_display': slot_time,
-                'start_time': slot['start_time'],
-                'end_time': slot['end_time'],
-                'attendee_count': attendee_count,
-                'total_participants': len(participants),
-                'overall_score': slot.get('overall_score', 0),
-                'conflicts': []  # Will be populated if needed
-            }
-            business_slots.append(business_slot)
-        
-        # Record all available options
-        record_slots(business_slots)
-        
-        record_negotiator(
-            action="analyze available options",
-            outcome=f"found {len(alternative_slots)} potential meeting times",
-            reasoning=f"Comprehensive analysis identified multiple options, now selecting the best one based on participant preferences"
-        )
+            # Record all available options
+            record_slots(business_slots)
+            
+            record_negotiator(
+                action="analyze available options",
+                outcome=f"found {len(alternative_slots)} potential meeting times",
+                reasoning=f"Comprehensive analysis identified multiple options, now selecting the best one based on participant preferences"
+            )
         
         # Select the best option
         best_slot = await self._negotiate_best_slot(participants, alternative_slots)
@@ -135,66 +210,52 @@ class NegotiatorAgent:
             
             return self._create_failure_response(meeting_request, "Could not find acceptable compromise")
         
-        selected_time = best_slot['slot']['time_display']
+        selected_time = best_slot['slot'].time_display
         consensus_score = best_slot['consensus_score']
         
-        # Create detailed reasoning for selection
-        selection_reasoning = self._create_selection_reasoning(best_slot, alternative_slots, participants)
-        
-        record_negotiator(
-            action="select optimal time",
-            outcome=f"chose {selected_time} as best option",
-            reasoning=f"After analyzing all options, {selected_time} provides the best balance of participant availability and preferences"
-        )
-        
-        # Record the final selection with detailed reasoning
-        record_selection(
-            selected_slot={
-                'time_display': selected_time,
-                'start_time': best_slot['slot']['start_time'],
-                'end_time': best_slot['slot']['end_time']
-            },
-            reasoning=selection_reasoning
-        )
+        if RECORDING_ENABLED:
+            # Create detailed reasoning for selection
+            selection_reasoning = self._create_selection_reasoning(best_slot, alternative_slots, participants)
+            
+            record_negotiator(
+                action="select optimal time",
+                outcome=f"chose {selected_time} as best option",
+                reasoning=f"After analyzing all options, {selected_time} provides the best balance of participant availability and preferences"
+            )
+            
+            # Record the final selection with detailed reasoning
+            record_selection(
+                selected_slot={
+                    'time_display': selected_time,
+                    'start_time': best_slot['slot'].start_time,
+                    'end_time': best_slot['slot'].end_time
+                },
+                reasoning=selection_reasoning
+            )
         
-        print(f"Selected best slot: {selected_time}")
+        logger.debug("Selected best slot: %s", selected_time)
         return self._create_success_response(best_slot, meeting_request, alternative_slots)
     
-    def _create_selection_reasoning(self, best_slot: Dict, all_slots: List[Dict], participants: List) -> str:
+    def _create_selection_reasoning(self, best_slot: Dict, all_slots: List[ScoredSlot], participants: List) -> str:
         """Create detailed business reasoning for slot selection"""
-        selected_time = best_slot['slot']['time_display']
+        selected_time = best_slot['slot'].time_display
         consensus_score = best_slot['consensus_score']
         
-        # Count how many alternatives were considered
-        total_options = len(all_slots)
-        
-        # Analyze why this slot was best
-        reasoning_parts = []
-        
-        # Primary reason - availability
-        reasoning_parts.append(f"Selected {selected_time} after analyzing {total_options} possible times")
-        
         # Consensus quality
-        if consensus_score >= 0.8:
-            reasoning_parts.append("it achieved excellent agreement among all participants")
-        elif consensus_score >= 0.6:
-            reasoning_parts.append("it provided good balance of everyone's preferences")
-        else:
-            reasoning_parts.append("it was the best available compromise")
+        consensus_phrase = next(phrase for threshold, phrase in self._CONSENSUS_PHRASES
+                                if consensus_score >= threshold)
         
         # Additional factors
-        hour = datetime.fromisoformat(best_slot['slot']['start_time']).hour
-        if 9 <= hour <= 11:
-            reasoning_parts.append("morning timing works well for focus and energy levels")
-        elif 13 <= hour <= 15:
-            reasoning_parts.append("early afternoon timing avoids lunch conflicts")
+        hour_phrase = self._HOUR_PHRASES.get(best_slot['slot'].hour)
+        
+        reasoning = f"Selected {selected_time} after analyzing {len(all_slots)} possible times. {consensus_phrase}"
+        if hour_phrase:
+            reasoning = f"{reasoning}. {hour_phrase}"
         
         # Participant considerations
-        reasoning_parts.append(f"ensures all {len(participants)} participants can attend")
+        reasoning = f"{reasoning}. ensures all {len(participants)} participants can attend"
         
-        return ". ".join(reasoning_parts).capitalize() + "."
-
-
+        return reasoning.capitalize() + "."
 
     
     def _build_requested_time(self, parsed_email: Dict, target_date: str, duration_mins: int) -> Dict:
@@ -205,34 +266,38 @@ class NegotiatorAgent:
         
         try:
             # Parse date and time
-            date_obj = datetime.strptime(target_date, '%Y-%m-%d')
+            date_obj = _parse_date(target_date)
             time_parts = suggested_time.split(':')
             hour = int(time_parts[0])
             minute = int(time_parts[1]) if len(time_parts) > 1 else 0
             
-            # Create datetime objects
-            start_dt = date_obj.replace(hour=hour, minute=minute)
-            end_dt = start_dt + timedelta(minutes=duration_mins)
-            
-            # Add timezone (IST)
-            start_dt = self.default_timezone.localize(start_dt)
-            end_dt = self.default_timezone.localize(end_dt)
+            # Create datetime objects, localizing once (IST) and deriving the end
+            start_dt = self.default_timezone.localize(date_obj.replace(hour=hour, minute=minute))
+            end_dt = self.default_timezone.normalize(start_dt + timedelta(minutes=duration_mins))
             
             return {
                 'start': start_dt.isoformat(),
                 'end': end_dt.isoformat()
             }
         except Exception as e:
-            print(f"Error building requested time: {e}")
+            logger.warning("Error building requested time: %s", e)
             return None
     
-    async def _evaluate_specific_time(self, participants: List, requested_time: Dict, duration_mins: int) -> Dict:
-        """Evaluate if all participants can meet at requested time"""
+    async def _evaluate_specific_time(self, participants: List, requested_time: Dict, duration_mins: int,
+                                      fail_fast: bool = True) -> Dict:
+        """Evaluate if all participants can meet at requested time
+        
+        With fail_fast, stops at the first rejection since a single conflict
+        already rules the requested time out; the conflicts list is then partial.
+        """
         evaluations = []
         conflicts = []
         
         # Collect evaluations from all participants
         for participant in participants:
+            if fail_fast and conflicts:
+                break
+            
             try:
                 evaluation = await participant.evaluate_proposal({
                     'start_time': requested_time['start'],
@@ -247,7 +312,7 @@ class NegotiatorAgent:
                         'timezone': evaluation.get('timezone', 'Asia/Kolkata')  # Default timezone
                     })
             except Exception as e:
-                print(f"Error evaluating proposal for {participant.email}: {e}")
+                logger.warning("Error evaluating proposal for %s: %s", participant.email, e)
                 # Add default rejection for failed evaluation
                 evaluations.append({
                     'decision': 'REJECT',
@@ -263,7 +328,7 @@ class NegotiatorAgent:
                 })
         
         success = len(conflicts) == 0
-        consensus_score = sum(e.get('preference_score', 0) for e in evaluations) / len(evaluations) if evaluations else 0
+        consensus_score = fmean([e.get('preference_score', 0) for e in evaluations]) if evaluations else 0
         
         return {
             'success': success,
@@ -277,102 +342,109 @@ class NegotiatorAgent:
             'consensus_score': consensus_score
         }
     
-    async def _find_alternative_slots(self, participants: List, target_date: str, duration_mins: int) -> List[Dict]:
+    async def _find_alternative_slots(self, participants: List, target_date: str, duration_mins: int) -> List[ScoredSlot]:
         """Find all possible alternative slots"""
         all_available_slots = {}
         
-        # Collect available slots from each participant
-        for participant in participants:
-            try:
-                slots = participant.find_available_slots(target_date, duration_mins)
-                all_available_slots[participant.email] = slots
-                print(f"  {participant.email}: {len(slots)} available slots")
-            except Exception as e:
-                print(f"Error finding slots for {participant.email}: {e}")
+        # Collect available slots from all participants in parallel
+        results = await asyncio.gather(
+            *(asyncio.to_thread(p.find_available_slots, target_date, duration_mins) for p in participants),
+            return_exceptions=True
+        )
+        for participant, slots in zip(participants, results):
+            if isinstance(slots, Exception):
+                logger.warning("Error finding slots for %s: %s", participant.email, slots)
                 all_available_slots[participant.email] = []
+            else:
+                all_available_slots[participant.email] = slots
+                logger.debug("  %s: %d available slots", participant.email, len(slots))
         
         # Find common slots across all participants
         common_slots = self._find_common_time_slots(all_available_slots, duration_mins)
-        print(f"Found {len(common_slots)} common time slots")
+        logger.debug("Found %d common time slots", len(common_slots))
         
         # Score and rank slots
         scored_slots = []
         for slot in common_slots:
             try:
+                # Parse once and reuse for scoring, display and reasoning
+                dt = datetime.fromisoformat(slot['start_time'])
+                slot['_dt'] = dt
+                
                 consensus_score = await self._calculate_consensus_score(participants, slot)
                 timezone_fairness = self._calculate_timezone_fairness(participants, slot)
                 
-                scored_slots.append({
-                    'start_time': slot['start_time'],
-                    'end_time': slot['end_time'],
-                    'consensus_score': consensus_score,
-                    'timezone_fairness': timezone_fairness,
-                    'overall_score': consensus_score * 0.7 + timezone_fairness * 0.3,
-                    'time_display': self._format_time_display(slot['start_time'])
-                })
+                scored_slots.append(ScoredSlot(
+                    start_time=slot['start_time'],
+                    end_time=slot['end_time'],
+                    start_epoch=slot['_start_epoch'],
+                    end_epoch=slot['_end_epoch'],
+                    consensus_score=consensus_score,
+                    timezone_fairness=timezone_fairness,
+                    overall_score=consensus_score * 0.7 + timezone_fairness * 0.3,
+                    time_display=self._format_time_display(slot['start_time'], dt),
+                    start_dt=dt,
+                    display_12h=dt.strftime('%I:%M %p')
+                ))
             except Exception as e:
-                print(f"Error scoring slot {slot}: {e}")
+                logger.warning("Error scoring slot %s: %s", slot, e)
                 continue
         
         # Return top 10 alternatives sorted by overall score
-        return sorted(scored_slots, key=lambda x: x['overall_score'], reverse=True)[:10]
+        # (earliest slot wins ties)
+        return heapq.nlargest(10, scored_slots, key=lambda x: (x.overall_score, -x.start_epoch))
     
     def _find_common_time_slots(self, all_slots: Dict, duration_mins: int) -> List[Dict]:
         """Find overlapping time slots across all participants"""
         if not all_slots:
             return []
         
-        # Get all unique time slots
-        all_time_slots = set()
+        # Key slots by (start, end) epoch seconds so the same instant matches
+        # regardless of the offset it was written in
+        slot_counts = Counter()
+        first_seen = {}
         for participant_slots in all_slots.values():
+            participant_keys = set()
             for slot in participant_slots:
-                slot_key = (slot['start_time'], slot['end_time'])
-                all_time_slots.add(slot_key)
+                slot_key = (_to_epoch(slot['start_time']), _to_epoch(slot['end_time']))
+                participant_keys.add(slot_key)
+                first_seen.setdefault(slot_key, slot)
+            slot_counts.update(participant_keys)
         
-        # Filter to slots that work for ALL participants
+        # Keep slots that work for ALL participants, in chronological order
         common_slots = []
-        for start_time, end_time in all_time_slots:
-            works_for_all = True
-            
-            # Check if this time slot exists in every participant's available slots
-            for participant_email, participant_slots in all_slots.items():
-                participant_has_slot = any(
-                    slot['start_time'] == start_time and slot['end_time'] == end_time
-                    for slot in participant_slots
-                )
-                
-                if not participant_has_slot:
-                    works_for_all = False
-                    break
-            
-            if works_for_all:
-                common_slots.append({
-                    'start_time': start_time,
-                    'end_time': end_time
-                })
+        for slot_key in sorted(k for k, count in slot_counts.items() if count == len(all_slots)):
+            slot = first_seen[slot_key]
+            common_slots.append({
+                'start_time': slot['start_time'],
+                'end_time': slot['end_time'],
+                '_start_epoch': slot_key[0],
+                '_end_epoch': slot_key[1]
+            })
         
         return common_slots
     
     async def _calculate_consensus_score(self, participants: List, slot: Dict) -> float:
         """Calculate how well this slot works for all participants"""
-        total_score = 0
-        valid_participants = 0
+        scores = []
         
-        for participant in participants:
-            try:
-                evaluation = await participant.evaluate_proposal(slot)
-                total_score += evaluation.get('preference_score', 0)
-                valid_participants += 1
-            except Exception as e:
-                print(f"Error calculating consensus for {participant.email}: {e}")
+        # Participants evaluate concurrently so any LLM round-trips overlap
+        evaluations = await asyncio.gather(
+            *(participant.evaluate_proposal(slot) for participant in participants),
+            return_exceptions=True
+        )
+        for participant, evaluation in zip(participants, evaluations):
+            if isinstance(evaluation, Exception):
+                logger.warning("Error calculating consensus for %s: %s", participant.email, evaluation)
                 continue
+            scores.append(evaluation.get('preference_score', 0))
         
-        return total_score / valid_participants if valid_participants > 0 else 0
+        return fmean(scores) if scores else 0
     
     def _calculate_timezone_fairness(self, participants: List, slot: Dict) -> float:
         """Calculate timezone fairness score"""
         try:
-            start_time = datetime.fromisoformat(slot['start_time'])
+            start_time = self._slot_start(slot)
             
             # Check how fair the time is across different timezones
             timezone_scores = []
@@ -384,27 +456,19 @@ class NegotiatorAgent:
                         participant_tz = pytz.timezone(participant_tz)
                     
                     local_time = start_time.astimezone(participant_tz)
-                    hour = local_time.hour
                     
                     # Score based on business hours (9-17 is optimal)
-                    if 9 <= hour <= 17:
-                        timezone_scores.append(1.0)
-                    elif 8 <= hour <= 18:
-                        timezone_scores.append(0.8)
-                    elif 7 <= hour <= 19:
-                        timezone_scores.append(0.6)
-                    else:
-                        timezone_scores.append(0.2)
-                except Exception as e:
-                    print(f"Error calculating timezone fairness for {participant.email}: {e}")
+                    timezone_scores.append(HOUR_SCORE[local_time.hour])
+                except (KeyError, ValueError, pytz.UnknownTimeZoneError) as e:
+                    logger.warning("Error calculating timezone fairness for %s: %s", participant.email, e)
                     timezone_scores.append(0.5)  # Default score
             
-            return sum(timezone_scores) / len(timezone_scores) if timezone_scores else 0.5
-        except Exception as e:
-            print(f"Error in timezone fairness calculation: {e}")
+            return fmean(timezone_scores) if timezone_scores else 0.5
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning("Error in timezone fairness calculation: %s", e)
             return 0.5
     
-    async def _negotiate_best_slot(self, participants: List, alternative_slots: List[Dict]) -> Dict:
+    async def _negotiate_best_slot(self, participants: List, alternative_slots: List[ScoredSlot]) -> Dict:
         """Select the best slot through LLM-powered negotiation"""
         if not alternative_slots:
             return None
@@ -415,21 +479,23 @@ class NegotiatorAgent:
             llm_response = await self.llm.generate_async(negotiation_prompt, max_tokens=200)
             selected_index = self._parse_llm_selection(llm_response, len(alternative_slots))
         except Exception as e:
-            print(f"LLM negotiation failed: {e}")
+            logger.warning("LLM negotiation failed: %s", e)
             selected_index = 0  # Fallback to highest scored slot
             llm_response = "Selected highest scored option due to LLM failure"
         
         # Get the selected slot
         best_slot = alternative_slots[selected_index]
+        proposal = {'start_time': best_slot.start_time, 'end_time': best_slot.end_time}
         
-        # Gather final evaluations
+        # Gather final evaluations concurrently
+        evaluations = await asyncio.gather(
+            *(participant.evaluate_proposal(proposal) for participant in participants),
+            return_exceptions=True
+        )
         final_evaluations = []
-        for participant in participants:
-            try:
-                evaluation = await participant.evaluate_proposal(best_slot)
-                final_evaluations.append(evaluation)
-            except Exception as e:
-                print(f"Error in final evaluation for {participant.email}: {e}")
+        for participant, evaluation in zip(participants, evaluations):
+            if isinstance(evaluation, Exception):
+                logger.warning("Error in final evaluation for %s: %s", participant.email, evaluation)
                 final_evaluations.append({
                     'decision': 'ACCEPT',
                     'reason': 'default_accept',
@@ -437,17 +503,19 @@ class NegotiatorAgent:
                     'participant': participant.email,
                     'timezone': 'Asia/Kolkata'
                 })
+            else:
+                final_evaluations.append(evaluation)
         
         return {
             'success': True,
             'slot': best_slot,
             'evaluations': final_evaluations,
             'conflicts': [],
-            'consensus_score': best_slot['overall_score'],
+            'consensus_score': best_slot.overall_score,
             'selection_reasoning': llm_response
         }
     
-    async def _build_negotiation_prompt(self, participants: List, alternatives: List[Dict]) -> str:
+    async def _build_negotiation_prompt(self, participants: List, alternatives: List[ScoredSlot]) -> str:
         """Build prompt for LLM-powered negotiation"""
         participant_info = []
         for p in participants:
@@ -462,7 +530,7 @@ class NegotiatorAgent:
         
         alternatives_info = []
         for i, alt in enumerate(alternatives[:5]):  # Top 5 only
-            alternatives_info.append(f"{i}: {alt['time_display']} (score: {alt['overall_score']:.2f})")
+            alternatives_info.append(f"{i}: {alt.time_display} (score: {alt.overall_score:.2f})")
         
         prompt = f"""
         You are an AI meeting negotiator. Select the best meeting time for these participants:
@@ -483,19 +551,19 @@ class NegotiatorAgent:
         """Parse LLM response to extract selected option"""
         try:
             # Extract number from response
-            import re
-            numbers = re.findall(r'\b(\d+)\b', llm_response)
-            if numbers:
-                selected = int(numbers[0])
-                return min(selected, max_options - 1)
-        except:
+            match = _LLM_NUM_RE.search(llm_response or '')
+            if match:
+                return min(int(match.group()), max_options - 1)
+        except ValueError:
             pass
         
         return 0  # Default to first option
     
-    def _create_success_response(self, result: Dict, meeting_request: Dict, alternatives: List[Dict]) -> Dict:
+    def _create_success_response(self, result: Dict, meeting_request: Dict, alternatives: List[ScoredSlot]) -> Dict:
         """Create successful scheduling response"""
         slot = result['slot']
+        if isinstance(slot, ScoredSlot):
+            slot = slot.to_dict()
         
         return {
             'success': True,
@@ -504,14 +572,7 @@ class NegotiatorAgent:
                 'end_time': slot['end_time'],
                 'display_time': slot['time_display']
             },
-            'alternatives_considered': [
-                {
-                    'start_time': alt['start_time'],
-                    'end_time': alt['end_time'],
-                    'overall_score': alt['overall_score'],
-                    'time_display': alt['time_display']
-                } for alt in alternatives[:5]
-            ],
+            'alternatives_considered': [alt.to_dict() for alt in alternatives[:5]],
             'negotiation_summary': {
                 'consensus_score': result['consensus_score'],
                 'conflicts_resolved': len([e for e in result['evaluations'] if e['decision'] == 'ACCEPT']),
@@ -539,10 +600,18 @@ class NegotiatorAgent:
         tomorrow = datetime.now() + timedelta(days=1)
         return tomorrow.strftime("%Y-%m-%d")
     
-    def _format_time_display(self, iso_time: str) -> str:
-        """Format time for display"""
+    def _format_time_display(self, iso_time: str, dt: datetime = None) -> str:
+        """Format time for display, reusing an already parsed datetime if given"""
         try:
-            dt = datetime.fromisoformat(iso_time)
+            if dt is None:
+                dt = datetime.fromisoformat(iso_time)
             return dt.strftime("%H:%M IST")
-        except:
-            return iso_time
\ No newline at end of file
+        except (TypeError, ValueError):
+            return iso_time
+    
+    def _slot_start(self, slot: Dict) -> datetime:
+        """Get the parsed start time of a slot, using the cached value when present"""
+        dt = slot.get('_dt')
+        if dt is None:
+            dt = datetime.fromisoformat(slot['start_time'])
+        return dt
\ No newline at end of file
@@ -4,6 +4,15 @@ from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from typing import List, Dict, Any
 import asyncio
+import re
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pytz
+from llm_service import llm_semaphore
+from negotiator_agent import HOUR_SCORE
 from models import NegotiationResult, TimeSlot, ParticipantEvaluation, MeetingRequest
 from participant_agent_pydantic import ParticipantAgent
 from tools import (
@@ -13,8 +22,33 @@ from tools import (
     generate_time_slots
 )
 
+# First standalone number in the agent's selection text
+_LLM_NUM_RE = re.compile(r'\b\d+\b')
+
+# Top slot wins outright (no LLM arbitration) when it leads the runner-up by more than this
+_DOMINANT_SCORE_GAP = 0.15
+
+# Weight of each decision's preference score in the consensus score (REJECT contributes 0)
+_DECISION_WEIGHT = {'ACCEPT': 1.0, 'CONDITIONAL_ACCEPT': 0.7, 'REJECT': 0.0}
+
+
+def _slot_key(slot: TimeSlot) -> tuple:
+    """(start, end) as integer epoch seconds, so the same instant matches in any offset."""
+    return (int(datetime.fromisoformat(slot.start_time).timestamp()),
+            int(datetime.fromisoformat(slot.end_time).timestamp()))
+
+
+@lru_cache(maxsize=512)
+def _tz(name: str):
+    """Resolve a timezone name once and reuse the tzinfo object."""
+    return pytz.timezone(name)
+
+
 class NegotiatorAgent:
-    def __init__(self, base_url: str = "http://localhost:3000/v1"):
+    def __init__(self, base_url: str = "http://localhost:3000/v1", max_concurrent_evaluations: int = 8):
+        # Upper bound on participant evaluations in flight against the LLM server
+        self.max_concurrent_evaluations = max_concurrent_evaluations
+        
         # Create provider for local vLLM DeepSeek server
         provider = OpenAIProvider(
             base_url=base_url,
@@ -74,9 +108,11 @@ Always provide detailed reasoning for your scheduling decisions."""
             target_date = meeting_request.target_date
             duration_mins = int(meeting_request.Duration_mins)
             
+            slot_lists = await asyncio.gather(
+                *(participant.find_available_slots(target_date, duration_mins) for participant in participants)
+            )
             all_participant_slots = {}
-            for participant in participants:
-                slots = await participant.find_available_slots(target_date, duration_mins)
+            for participant, slots in zip(participants, slot_lists):
                 all_participant_slots[participant.email] = slots
                 print(f"  {participant.email}: {len(slots)} available slots")
             
@@ -94,13 +130,16 @@ Always provide detailed reasoning for your scheduling decisions."""
                 )
             
             # Step 3: Evaluate each common slot with all participants
+            participant_tzs = [_tz(p.preferences.get('timezone', 'Asia/Kolkata')) for p in participants]
+            local_hours = self._local_start_hours(common_slots, participant_tzs)
+            
+            evaluation_matrix = await self._evaluate_slots_with_participants(common_slots, participants)
+            
             evaluated_slots = []
-            for slot in common_slots:
-                evaluations = await self._evaluate_slot_with_participants(slot, participants)
-                
+            for slot, slot_hours, evaluations in zip(common_slots, local_hours, evaluation_matrix):
                 # Calculate consensus score
                 consensus_score = self._calculate_consensus_score(evaluations)
-                timezone_fairness = self._calculate_timezone_fairness(slot, participants)
+                timezone_fairness = self._calculate_timezone_fairness(slot_hours)
                 
                 slot.overall_score = consensus_score * 0.7 + timezone_fairness * 0.3
                 slot.timezone_fairness = timezone_fairness
@@ -147,154 +186,154 @@ Always provide detailed reasoning for your scheduling decisions."""
         if not all_participant_slots:
             return []
         
-        # Get all unique time slots
-        all_time_slots = set()
-        for participant_slots in all_participant_slots.values():
-            for slot in participant_slots:
-                slot_key = (slot.start_time, slot.end_time)
-                all_time_slots.add(slot_key)
+        # Epoch keys per participant, computed once; slot details come from the first participant
+        keyed_slots = [
+            {_slot_key(slot): slot for slot in participant_slots}
+            for participant_slots in all_participant_slots.values()
+        ]
+        first_slot_map = keyed_slots[0]
+        
+        # Sorted keys per participant, shortest list first
+        key_lists = sorted((sorted(slot_map) for slot_map in keyed_slots), key=len)
+        
+        # Cheap prefilter: an empty list or non-overlapping key ranges rule out any common slot
+        if not key_lists[0] or max(keys[0] for keys in key_lists) > min(keys[-1] for keys in key_lists):
+            return []
         
-        # Filter to slots available for ALL participants
         common_slots = []
-        for start_time, end_time in all_time_slots:
-            available_for_all = True
+        for slot_key in self._intersect_sorted(key_lists):
+            matching_slot = first_slot_map[slot_key]
             
-            for participant_email, participant_slots in all_participant_slots.items():
-                participant_has_slot = any(
-                    slot.start_time == start_time and slot.end_time == end_time
-                    for slot in participant_slots
-                )
-                
-                if not participant_has_slot:
-                    available_for_all = False
-                    break
-            
-            if available_for_all:
-                # Get the slot details from first participant
-                first_participant_slots = list(all_participant_slots.values())[0]
-                matching_slot = next(
-                    slot for slot in first_participant_slots 
-                    if slot.start_time == start_time and slot.end_time == end_time
-                )
-                
-                common_slot = TimeSlot(
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration_minutes=matching_slot.duration_minutes,
-                    participants=list(all_participant_slots.keys()),
-                    time_display=matching_slot.time_display
-                )
-                common_slots.append(common_slot)
+            common_slot = TimeSlot(
+                start_time=matching_slot.start_time,
+                end_time=matching_slot.end_time,
+                duration_minutes=matching_slot.duration_minutes,
+                participants=list(all_participant_slots.keys()),
+                time_display=matching_slot.time_display
+            )
+            common_slots.append(common_slot)
         
         return common_slots
     
-    async def _evaluate_slot_with_participants(self, 
-                                             slot: TimeSlot, 
-                                             participants: List[ParticipantAgent]) -> List[ParticipantEvaluation]:
-        """Get evaluations from all participants for a time slot."""
-        evaluation_tasks = []
-        for participant in participants:
-            task = participant.evaluate_proposal(slot)
-            evaluation_tasks.append(task)
+    def _intersect_sorted(self, key_lists: List[List[tuple]]) -> List[tuple]:
+        """K-way sort-merge intersection of sorted, de-duplicated key lists."""
+        positions = [0] * len(key_lists)
+        common_keys = []
+        
+        while all(pos < len(keys) for pos, keys in zip(positions, key_lists)):
+            max_key = max(keys[pos] for pos, keys in zip(positions, key_lists))
+            
+            # Jump every list that is behind straight to max_key
+            all_match = True
+            for i, keys in enumerate(key_lists):
+                if keys[positions[i]] < max_key:
+                    positions[i] = bisect_left(keys, max_key, positions[i] + 1)
+                    all_match = False
+            
+            if all_match:
+                common_keys.append(max_key)
+                positions = [pos + 1 for pos in positions]
         
-        evaluations = await asyncio.gather(*evaluation_tasks, return_exceptions=True)
+        return common_keys
+    
+    async def _evaluate_slots_with_participants(self, 
+                                              slots: List[TimeSlot], 
+                                              participants: List[ParticipantAgent]) -> List[List[ParticipantEvaluation]]:
+        """Get evaluations from all participants for every slot, as [slot][participant]."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_evaluations)
         
-        # Filter out exceptions and return valid evaluations
-        valid_evaluations = []
-        for i, evaluation in enumerate(evaluations):
-            if isinstance(evaluation, Exception):
-                print(f"Evaluation failed for participant {participants[i].email}: {evaluation}")
-                # Create default evaluation
-                valid_evaluations.append(ParticipantEvaluation(
-                    participant=participants[i].email,
-                    decision='REJECT',
-                    reason='evaluation_failed',
-                    preference_score=0.0,
-                    timezone=participants[i].preferences.get('timezone', 'Asia/Kolkata'),
-                    llm_reasoning='Evaluation failed due to system error'
-                ))
-            else:
-                valid_evaluations.append(evaluation)
+        async def bounded_evaluation(participant: ParticipantAgent, slot: TimeSlot):
+            async with semaphore:
+                return await participant.evaluate_proposal(slot)
         
-        return valid_evaluations
+        # One gather over every (slot, participant) pair
+        evaluations = await asyncio.gather(
+            *(bounded_evaluation(participant, slot) for slot in slots for participant in participants),
+            return_exceptions=True
+        )
+        
+        # Reshape into rows per slot, replacing exceptions with default evaluations
+        evaluation_matrix = []
+        for row_start in range(0, len(evaluations), len(participants)):
+            valid_evaluations = []
+            for participant, evaluation in zip(participants, evaluations[row_start:row_start + len(participants)]):
+                if isinstance(evaluation, Exception):
+                    print(f"Evaluation failed for participant {participant.email}: {evaluation}")
+                    # Create default evaluation
+                    valid_evaluations.append(ParticipantEvaluation(
+                        participant=participant.email,
+                        decision='REJECT',
+                        reason='evaluation_failed',
+                        preference_score=0.0,
+                        timezone=participant.preferences.get('timezone', 'Asia/Kolkata'),
+                        llm_reasoning='Evaluation failed due to system error'
+                    ))
+                else:
+                    valid_evaluations.append(evaluation)
+            evaluation_matrix.append(valid_evaluations)
+        
+        return evaluation_matrix
     
     def _calculate_consensus_score(self, evaluations: List[ParticipantEvaluation]) -> float:
         """Calculate overall consensus score from participant evaluations."""
         if not evaluations:
             return 0.0
         
-        total_score = 0.0
-        for evaluation in evaluations:
-            if evaluation.decision == 'ACCEPT':
-                total_score += evaluation.preference_score
-            elif evaluation.decision == 'CONDITIONAL_ACCEPT':
-                total_score += evaluation.preference_score * 0.7
-            # REJECT contributes 0
+        total_score = sum(_DECISION_WEIGHT[evaluation.decision] * evaluation.preference_score
+                          for evaluation in evaluations)
         
         return total_score / len(evaluations)
     
-    def _calculate_timezone_fairness(self, slot: TimeSlot, participants: List[ParticipantAgent]) -> float:
-        """Calculate timezone fairness score for a time slot."""
-        try:
-            from datetime import datetime
-            import pytz
-            
-            start_time = datetime.fromisoformat(slot.start_time)
-            
-            timezone_scores = []
-            for participant in participants:
-                participant_tz = participant.preferences.get('timezone', 'Asia/Kolkata')
-                tz = pytz.timezone(participant_tz)
-                local_time = start_time.astimezone(tz)
-                hour = local_time.hour
-                
-                # Score based on business hours preference
-                if 9 <= hour <= 17:
-                    timezone_scores.append(1.0)
-                elif 8 <= hour <= 18:
-                    timezone_scores.append(0.8)
-                elif 7 <= hour <= 19:
-                    timezone_scores.append(0.6)
-                else:
-                    timezone_scores.append(0.2)
-            
-            return sum(timezone_scores) / len(timezone_scores) if timezone_scores else 0.5
-        except:
+    def _local_start_hours(self, slots: List[TimeSlot], participant_tzs: List) -> List[List[int]]:
+        """Local start hour of every slot for every participant, as [slot][participant]."""
+        starts = [datetime.fromisoformat(slot.start_time) for slot in slots]
+        return [[start.astimezone(tz).hour for tz in participant_tzs] for start in starts]
+    
+    def _calculate_timezone_fairness(self, hours: List[int]) -> float:
+        """Calculate timezone fairness score from each participant's local start hour."""
+        if not hours:
             return 0.5
+        return sum(HOUR_SCORE[hour] for hour in hours) / len(hours)
     
     async def _select_best_slot(self, 
                                evaluated_slots: List[Dict], 
                                participants: List[ParticipantAgent]) -> Dict[str, Any]:
         """Use AI agent to intelligently select the best time slot."""
         try:
-            # Sort by overall score first
-            sorted_slots = sorted(evaluated_slots, key=lambda x: x['slot'].overall_score or 0, reverse=True)
+            # Top 5 by overall score, best first
+            sorted_slots = self._top_slots(evaluated_slots, 5)
+            
+            # Fast path: a clearly dominant slot needs no LLM round-trip
+            if (len(sorted_slots) < 2 or
+                    (sorted_slots[0]['slot'].overall_score or 0) - (sorted_slots[1]['slot'].overall_score or 0) > _DOMINANT_SCORE_GAP):
+                best_slot_data = sorted_slots[0]
+                best_slot_data['reasoning'] = 'Dominant score; LLM arbitration skipped'
+                return best_slot_data
             
             # Prepare data for AI decision
             slot_summaries = []
-            for i, slot_data in enumerate(sorted_slots[:5]):  # Top 5 options
+            for i, slot_data in enumerate(sorted_slots):
                 slot = slot_data['slot']
                 evaluations = slot_data['evaluations']
                 
-                accept_count = sum(1 for e in evaluations if e.decision == 'ACCEPT')
-                conditional_count = sum(1 for e in evaluations if e.decision == 'CONDITIONAL_ACCEPT')
-                reject_count = sum(1 for e in evaluations if e.decision == 'REJECT')
+                decision_counts = Counter(e.decision for e in evaluations)
+                accept_count = decision_counts['ACCEPT']
+                conditional_count = decision_counts['CONDITIONAL_ACCEPT']
+                reject_count = decision_counts['REJECT']
                 
-                slot_summaries.append(f"""
-                Option {i}: {slot.time_display}
-                - Overall Score: {slot.overall_score:.2f}
-                - Consensus: {slot_data['consensus_score']:.2f}
-                - Timezone Fairness: {slot.timezone_fairness:.2f}
-                - Responses: {accept_count} Accept, {conditional_count} Conditional, {reject_count} Reject
-                """)
+                # One compact line per option keeps the prompt (and vLLM prefill) short
+                slot_summaries.append(
+                    f"{i}: {slot.time_display} | score={slot.overall_score:.2f} cons={slot_data['consensus_score']:.2f} "
+                    f"fair={slot.timezone_fairness:.2f} A={accept_count} C={conditional_count} R={reject_count}"
+                )
             
             participant_timezones = [p.preferences.get('timezone', 'Asia/Kolkata') for p in participants]
             
             prompt = f"""
             Select the best meeting time for {len(participants)} participants across timezones: {set(participant_timezones)}
             
-            Available options:
-            {''.join(slot_summaries)}
+            Available options (score=overall, cons=consensus, fair=timezone fairness; A/C/R = accept/conditional/reject counts):
+{chr(10).join(slot_summaries)}
             
             Consider:
             - Maximum participant acceptance
@@ -302,23 +341,20 @@ Always provide detailed reasoning for your scheduling decisions."""
             - Overall consensus scores
             - Business hour appropriateness
             
-            Return the option number (0-{len(sorted_slots[:5])-1}) of your selection with reasoning.
+            Return the option number (0-{len(sorted_slots)-1}) of your selection with reasoning.
             """
             
-            result = await self.agent.run(prompt)
+            async with llm_semaphore():
+                result = await self.agent.run(prompt)
             
             # Parse the selection (try to extract number from response)
             selection_text = str(result.data.selection_reasoning) if hasattr(result.data, 'selection_reasoning') else str(result.data)
             
-            import re
-            numbers = re.findall(r'\b(\d+)\b', selection_text)
+            match = _LLM_NUM_RE.search(selection_text)
             selected_index = 0  # Default to first option
             
-            if numbers:
-                try:
-                    selected_index = min(int(numbers[0]), len(sorted_slots) - 1)
-                except:
-                    selected_index = 0
+            if match:
+                selected_index = min(int(match.group()), len(sorted_slots) - 1)
             
             best_slot_data = sorted_slots[selected_index]
             best_slot_data['reasoning'] = selection_text
@@ -329,6 +365,18 @@ Always provide detailed reasoning for your scheduling decisions."""
             print(f"AI selection failed: {e}")
             # Return highest scored option
             if evaluated_slots:
-                sorted_slots = sorted(evaluated_slots, key=lambda x: x['slot'].overall_score or 0, reverse=True)
-                return sorted_slots[0]
-            return None
\ No newline at end of file
+                return max(evaluated_slots, key=lambda x: x['slot'].overall_score or 0)
+            return None
+    
+    def _top_slots(self, evaluated_slots: List[Dict], k: int) -> List[Dict]:
+        """The k highest-scoring slots, best first; ties keep their original order."""
+        if not evaluated_slots:
+            return []
+        scores = np.fromiter((x['slot'].overall_score or 0 for x in evaluated_slots), dtype=float, count=len(evaluated_slots))
+        k = min(k, len(scores))
+        
+        # Partition to find the k-th best score in O(N), then sort only the slots at or above it
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= threshold)
+        ranked = candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+        return [evaluated_slots[i] for i in ranked.tolist()]
\ No newline at end of file
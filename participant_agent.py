@@ -1,76 +1,194 @@
 import asyncio
-from datetime import datetime, timedelta
-import pytz
+import os
+from datetime import datetime, time
+from functools import lru_cache
 from typing import List, Dict, Any
 import json
+import numpy as np
+from zoneinfo import ZoneInfo
+from interval_index import IntervalIndex
 from llm_service import LLMService
 from metadata_framework import record_participant
 
+# The per-proposal LLM reasoning is cosmetic; only ask the model when explicitly enabled
+LLM_REASONING_ENABLED = os.getenv('LLM_PARTICIPANT_REASONING', 'False').lower() == 'true'
+
+# Business hours (local time) and slot granularity for availability search
+_BUSINESS_START = time(9)
+_BUSINESS_WINDOW_MINS = 9 * 60  # 9 AM to 6 PM
+_SLOT_STEP_MINS = 15
+
+# LLM prompt templates, filled with str.format; preferences go in as the agent's canonical JSON
+_EVALUATION_PROMPT = """
+        You are {email}'s scheduling assistant. Evaluate this meeting proposal:
+        
+        Proposed Time: {proposed_time}
+        Preference Score: {score:.2f} (0=poor, 1=excellent)
+        My Preferences: {preferences}
+        
+        Provide a brief, professional response explaining whether this time works well.
+        Keep it under 50 words.
+        """
+_ALTERNATIVE_PROMPT = """
+        Briefly explain why {time} on {day} 
+        would be a good alternative meeting time for someone with these preferences: {preferences}
+        
+        Keep it under 30 words and be specific about timing benefits.
+        """
+
+# Display names for hand-rolled formatting in hot paths (matches strftime in the C locale)
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+
+
+def _clock_12h(dt: datetime) -> str:
+    """Same as dt.strftime('%I:%M %p')"""
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+def _clock_24h(dt: datetime) -> str:
+    """Same as dt.strftime('%H:%M')"""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+@lru_cache(maxsize=64)
+def _slot_template(tz_name: str, date_str: str, duration_mins: int) -> tuple:
+    """Candidate slots of a business day as read-only (hours, start/end epochs, start/end ISO) arrays, shared per timezone"""
+    # Parse the target date
+    target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    
+    # Business hours: 9 AM to 6 PM in the given timezone
+    start_time = datetime.combine(target_date, _BUSINESS_START, tzinfo=ZoneInfo(tz_name))
+    
+    # Generate 15-minute slot offsets (minutes from 9 AM) as one array
+    offsets = np.arange(0, _BUSINESS_WINDOW_MINS - duration_mins + 1, _SLOT_STEP_MINS, dtype=np.int64)
+    slot_starts = int(start_time.timestamp()) + offsets * 60
+    slot_ends = slot_starts + duration_mins * 60
+    hours = (_BUSINESS_START.hour + offsets // 60) % 24
+    
+    # Format ISO strings from local wall-clock datetime64 values; every slot
+    # carries the 9 AM UTC offset
+    local_start = np.datetime64(start_time.replace(tzinfo=None), 's')
+    utc_offset = start_time.isoformat()[19:]
+    start_strs = np.array([s + utc_offset for s in np.datetime_as_string(local_start + offsets * 60, unit='s').tolist()])
+    end_strs = np.array([s + utc_offset for s in np.datetime_as_string(
+        local_start + offsets * 60 + int(duration_mins * 60), unit='s').tolist()])
+    
+    template = (hours, slot_starts, slot_ends, start_strs, end_strs)
+    for array in template:
+        array.setflags(write=False)
+    return template
+
+
 class ParticipantAgent:
     def __init__(self, email: str, calendar_data: List[Dict], preferences: Dict, llm_client=None):
         self.email = email
         self.calendar = calendar_data
         self.preferences = preferences
         self.llm = llm_client or LLMService()
-        self.timezone = pytz.timezone(preferences.get('timezone', 'Asia/Kolkata'))
+        self.timezone = ZoneInfo(preferences.get('timezone', 'Asia/Kolkata'))  # ZoneInfo caches instances per key
         
-    def find_available_slots(self, date_str: str, duration_mins: int, time_window_hours: int = 10) -> List[Dict]:
-        """Find all available time slots for the given date"""
-        available_slots = []
+        # LLM reasoning only varies with weekday and hour for a fixed set of preferences;
+        # the canonical preferences string (also used in prompts) lets participants with
+        # equal preferences share responses
+        self._preferences_key = json.dumps(preferences, sort_keys=True, default=str)
+        self._llm_cache = {}
+        self._alternative_reasoning_cache = {}
         
-        # Parse the target date
-        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        # Parse calendar events once as (start, end, event) in calendar order, and index
+        # them as epoch seconds (payload: calendar position) for O(log N) integer conflict checks
+        self._events = [
+            (self._parse_event_time(event['StartTime']), self._parse_event_time(event['EndTime']), event)
+            for event in calendar_data
+        ]
+        self._event_index = IntervalIndex(
+            (int(event_start.timestamp()), int(event_end.timestamp()), position)
+            for position, (event_start, event_end, _) in enumerate(self._events)
+        )
+        # The same index as arrays, for vectorized slot checks
+        self._sorted_starts_epoch = np.array(self._event_index.starts, dtype=np.int64)
+        self._running_max_end_epoch = np.array(self._event_index.running_max_end, dtype=np.int64)
+        self._buffer_secs = 60 * preferences.get('buffer_minutes', 15)
         
-        # Business hours: 9 AM to 6 PM in user's timezone
-        start_time = self.timezone.localize(datetime.combine(target_date, datetime.min.time().replace(hour=9)))
-        end_time = self.timezone.localize(datetime.combine(target_date, datetime.min.time().replace(hour=18)))
+        # Preference scoring inputs, resolved once instead of per scored hour
+        self._preferred_times = frozenset(preferences.get('preferred_times', []))
+        self._avoid_lunch = preferences.get('avoid_lunch', False)
+        self._seniority_factor = 0.7 + 0.6 * preferences.get('seniority_weight', 0.5)  # Higher seniority = higher weight
+        # Preference score per local start hour, as a list for scalar lookups and an array for slot scans
+        self._hour_scores = [self._preference_score_for_hour(hour) for hour in range(24)]
+        self._hour_score_array = np.array(self._hour_scores)
         
-        # Generate 15-minute slots
-        current_time = start_time
-        while current_time + timedelta(minutes=duration_mins) <= end_time:
-            slot_end = current_time + timedelta(minutes=duration_mins)
-            
-            if not self._has_conflict(current_time, slot_end):
-                preference_score = self._calculate_preference_score(current_time)
-                available_slots.append({
-                    'start_time': current_time.isoformat(),
-                    'end_time': slot_end.isoformat(),
-                    'preference_score': preference_score,
-                    'participant': self.email
-                })
-            
-            current_time += timedelta(minutes=15)
+        # The calendar is fixed for the agent's lifetime, so each (date, duration) scan runs once
+        self._slot_scan_cache = {}
+        
+    def find_available_slots(self, date_str: str, duration_mins: int) -> List[Dict]:
+        """Find all available time slots for the given date"""
+        scan_key = (date_str, duration_mins)
+        scanned = self._slot_scan_cache.get(scan_key)
+        if scanned is None:
+            scanned = self._slot_scan_cache[scan_key] = self._scan_available_slots(date_str, duration_mins)
         
-        return sorted(available_slots, key=lambda x: x['preference_score'], reverse=True)
+        # Fresh dicts each call, since callers may annotate them
+        return [
+            {
+                'start_time': slot_start,
+                'end_time': slot_end,
+                'preference_score': preference_score,
+                'participant': self.email
+            }
+            for slot_start, slot_end, preference_score in scanned
+        ]
     
-    def _has_conflict(self, start_time: datetime, end_time: datetime) -> bool:
-        """Check if proposed time conflicts with existing calendar events"""
-        for event in self.calendar:
-            event_start = datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00'))
-            event_end = datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00'))
-            
-            # Convert to same timezone for comparison
-            if event_start.tzinfo != start_time.tzinfo:
-                event_start = event_start.astimezone(start_time.tzinfo)
-                event_end = event_end.astimezone(start_time.tzinfo)
-            
-            # Check for overlap with buffer time
-            buffer_mins = self.preferences.get('buffer_minutes', 15)
-            buffered_start = start_time - timedelta(minutes=buffer_mins)
-            buffered_end = end_time + timedelta(minutes=buffer_mins)
-            
-            if not (buffered_end <= event_start or buffered_start >= event_end):
-                return True
+    def _scan_available_slots(self, date_str: str, duration_mins: int) -> List[tuple]:
+        """(start, end, preference score) of every free slot on the date, best preference first"""
+        hours, slot_starts, slot_ends, start_strs, end_strs = _slot_template(self.timezone.key, date_str, duration_mins)
         
-        return False
+        # Vectorized overlap test against all calendar events (with buffer time): per slot,
+        # find the events starting before its buffered end and compare their latest end
+        # with the buffered start, without materializing a slots x events matrix
+        free = np.ones(len(slot_starts), dtype=bool)
+        if self._events:
+            buffer_secs = self._buffer_secs
+            idx = np.searchsorted(self._sorted_starts_epoch, slot_ends + buffer_secs, side='left')
+            free = (idx == 0) | (self._running_max_end_epoch[np.maximum(idx - 1, 0)] <= slot_starts - buffer_secs)
+        
+        # Preference score depends only on the local hour
+        preference_scores = self._hour_score_array[hours]
+        
+        # Best preference first (stable, so ties stay chronological)
+        free_idx = np.flatnonzero(free)
+        free_idx = free_idx[np.argsort(-preference_scores[free_idx], kind='stable')]
+        
+        return list(zip(start_strs[free_idx].tolist(), end_strs[free_idx].tolist(), preference_scores[free_idx].tolist()))
+    
+    def _find_conflicts(self, start_time: datetime, end_time: datetime) -> tuple:
+        """Whether the slot conflicts (with buffer time), plus summaries of events overlapping the slot itself"""
+        positions = self._event_index.overlapping(
+            start_time.timestamp() - self._buffer_secs, end_time.timestamp() + self._buffer_secs
+        )
+        # Report in calendar order; events only within the buffer make no summary
+        conflicting_events = []
+        for position in sorted(positions):
+            event_start, event_end, event = self._events[position]
+            if not (end_time <= event_start or start_time >= event_end):
+                conflicting_events.append(event['Summary'])
+        return bool(positions), conflicting_events
+    
+    def _parse_event_time(self, iso_time: str) -> datetime:
+        """Parse a calendar event timestamp (Z or offset suffix)"""
+        return datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
     
     def _calculate_preference_score(self, start_time: datetime) -> float:
         """Calculate preference score for a time slot (0-1)"""
+        return self._hour_scores[start_time.hour]
+    
+    def _preference_score_for_hour(self, hour: int) -> float:
+        """Calculate preference score for a slot starting in the given local hour (0-1)"""
         score = 0.5  # Base score
-        hour = start_time.hour
         
         # Preferred times
-        preferred_times = self.preferences.get('preferred_times', [])
+        preferred_times = self._preferred_times
         if 'morning' in preferred_times and 9 <= hour < 12:
             score += 0.3
         elif 'afternoon' in preferred_times and 13 <= hour < 17:
@@ -79,12 +197,11 @@ class ParticipantAgent:
             score += 0.2
         
         # Avoid lunch time
-        if self.preferences.get('avoid_lunch', False) and 12 <= hour < 14:
+        if self._avoid_lunch and 12 <= hour < 14:
             score -= 0.4
         
         # Seniority weight
-        seniority = self.preferences.get('seniority_weight', 0.5)
-        score = score * (0.7 + 0.6 * seniority)  # Higher seniority = higher weight
+        score = score * self._seniority_factor
         
         return max(0, min(1, score))
     
@@ -93,24 +210,11 @@ class ParticipantAgent:
         
         start_time = datetime.fromisoformat(proposed_slot['start_time'])
         end_time = datetime.fromisoformat(proposed_slot['end_time'])
-        time_display = f"{start_time.strftime('%I:%M %p')} on {start_time.strftime('%A, %B %d')}"
-        
-        # Check for calendar conflicts
-        if self._has_conflict(start_time, end_time):
-            # Find what's conflicting
-            conflicting_events = []
-            for event in self.calendar:
-                event_start = datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00'))
-                event_end = datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00'))
-                
-                # Convert to same timezone for comparison
-                if event_start.tzinfo != start_time.tzinfo:
-                    event_start = event_start.astimezone(start_time.tzinfo)
-                    event_end = event_end.astimezone(start_time.tzinfo)
-                
-                # Check for overlap
-                if not (end_time <= event_start or start_time >= event_end):
-                    conflicting_events.append(event['Summary'])
+        time_display = f"{_clock_12h(start_time)} on {_DAY_NAMES[start_time.weekday()]}, {_MONTH_NAMES[start_time.month]} {start_time.day:02d}"
+        
+        # Check for calendar conflicts and find what's conflicting in one pass
+        has_conflict, conflicting_events = self._find_conflicts(start_time, end_time)
+        if has_conflict:
             
             conflict_description = conflicting_events[0] if conflicting_events else "another meeting"
             
@@ -166,7 +270,10 @@ class ParticipantAgent:
             decision = 'REJECT'
         
         # Use LLM for additional context
-        llm_evaluation = await self._evaluate_with_llm(proposed_slot, preference_score)
+        if LLM_REASONING_ENABLED:
+            llm_evaluation = await self._evaluate_with_llm(proposed_slot, preference_score)
+        else:
+            llm_evaluation = f"{hour}h slot, score {preference_score:.2f} - {self._day_band(hour)}"
         
         # Record the decision
         record_participant(
@@ -187,24 +294,36 @@ class ParticipantAgent:
         }
 
     
+    @staticmethod
+    def _day_band(hour: int) -> str:
+        """Name the part of the day a local hour falls in"""
+        if hour < 12:
+            return 'morning'
+        elif hour < 17:
+            return 'afternoon'
+        return 'evening'
+    
     async def _evaluate_with_llm(self, proposed_slot: Dict, preference_score: float) -> str:
         """Use LLM to generate evaluation reasoning"""
         start_time = datetime.fromisoformat(proposed_slot['start_time'])
+        cache_key = (start_time.weekday(), start_time.hour)
+        if cache_key in self._llm_cache:
+            return self._llm_cache[cache_key]
         
-        prompt = f"""
-        You are {self.email}'s scheduling assistant. Evaluate this meeting proposal:
-        
-        Proposed Time: {start_time.strftime('%A, %B %d at %I:%M %p %Z')}
-        Preference Score: {preference_score:.2f} (0=poor, 1=excellent)
-        My Preferences: {self.preferences}
-        
-        Provide a brief, professional response explaining whether this time works well.
-        Keep it under 50 words.
-        """
+        prompt = _EVALUATION_PROMPT.format(
+            email=self.email,
+            proposed_time=start_time.strftime('%A, %B %d at %I:%M %p %Z'),
+            score=preference_score,
+            preferences=self._preferences_key
+        )
         
         try:
-            response = await self.llm.generate_async(prompt, max_tokens=100)
-            return response.strip()
+            response = await self.llm.generate_async(
+                prompt, max_tokens=100,
+                cache_key=('evaluate', *cache_key, round(preference_score, 2), self._preferences_key)
+            )
+            self._llm_cache[cache_key] = response.strip()
+            return self._llm_cache[cache_key]
         except Exception as e:
             print(f"LLM evaluation failed for {self.email}: {e}")
             return f"Time preference score: {preference_score:.2f}"
@@ -214,19 +333,21 @@ class ParticipantAgent:
         available_slots = self.find_available_slots(target_date.strftime("%Y-%m-%d"), duration_mins)
         
         # Return top 3 alternatives
+        top_slots = available_slots[:3]
+        start_dts = [datetime.fromisoformat(slot['start_time']) for slot in top_slots]
+        
+        # Use LLM to generate reasoning for all alternatives concurrently
+        reasonings = await asyncio.gather(*(self._generate_alternative_reasoning(start_dt) for start_dt in start_dts))
+        
         alternatives = []
-        for slot in available_slots[:3]:
-            start_dt = datetime.fromisoformat(slot['start_time'])
+        for slot, start_dt, reasoning in zip(top_slots, start_dts, reasonings):
             end_dt = datetime.fromisoformat(slot['end_time'])
             
-            # Use LLM to generate reasoning for this alternative
-            reasoning = await self._generate_alternative_reasoning(start_dt)
-            
             alternatives.append({
                 'start_time': slot['start_time'],
                 'end_time': slot['end_time'],
                 'preference_score': slot['preference_score'],
-                'time_display': f"{start_dt.strftime('%H:%M')} - {end_dt.strftime('%H:%M')} {start_dt.tzname()}",
+                'time_display': f"{_clock_24h(start_dt)} - {_clock_24h(end_dt)} {start_dt.tzname()}",
                 'reasoning': reasoning
             })
         
@@ -234,16 +355,22 @@ class ParticipantAgent:
     
     async def _generate_alternative_reasoning(self, start_time: datetime) -> str:
         """Generate reasoning for alternative time suggestion"""
-        prompt = f"""
-        Briefly explain why {start_time.strftime('%I:%M %p')} on {start_time.strftime('%A')} 
-        would be a good alternative meeting time for someone with these preferences: {self.preferences}
+        cache_key = (start_time.weekday(), start_time.hour)
+        if cache_key in self._alternative_reasoning_cache:
+            return self._alternative_reasoning_cache[cache_key]
         
-        Keep it under 30 words and be specific about timing benefits.
-        """
+        prompt = _ALTERNATIVE_PROMPT.format(
+            time=_clock_12h(start_time),
+            day=_DAY_NAMES[start_time.weekday()],
+            preferences=self._preferences_key
+        )
         
         try:
-            response = await self.llm.generate_async(prompt, max_tokens=60)
-            return response.strip()
+            response = await self.llm.generate_async(
+                prompt, max_tokens=60, cache_key=('alternative', *cache_key, self._preferences_key)
+            )
+            self._alternative_reasoning_cache[cache_key] = response.strip()
+            return self._alternative_reasoning_cache[cache_key]
         except Exception as e:
             print(f"Alternative reasoning generation failed: {e}")
             hour = start_time.hour
@@ -3,11 +3,14 @@ from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from typing import List, Dict, Any
+from llm_service import llm_semaphore
 from models import ParticipantEvaluation, TimeSlot, UserPreferences, CalendarEvent
 from tools import (
     get_current_date, 
     find_calendar_conflicts, 
+    find_calendar_conflicts_batch,
     calculate_preference_score,
+    calculate_preference_scores,
     check_business_hours,
     convert_time_across_timezones,
     generate_time_slots
@@ -87,7 +90,8 @@ Always provide honest, helpful feedback about proposed meeting times."""
             Provide a decision (ACCEPT/REJECT/CONDITIONAL_ACCEPT) with clear reasoning.
             """
             
-            result = await self.agent.run(prompt)
+            async with llm_semaphore():
+                result = await self.agent.run(prompt)
             return result.data
             
         except Exception as e:
@@ -105,39 +109,38 @@ Always provide honest, helpful feedback about proposed meeting times."""
     async def find_available_slots(self, date: str, duration_minutes: int) -> List[TimeSlot]:
         """Find available time slots for a given date."""
         try:
-            # Generate all possible slots for the day
+            # Generate all possible slots for the day; internal calls use the plain
+            # functions behind the agent tools and skip the Tool wrapper
             timezone = self.preferences.get('timezone', 'Asia/Kolkata')
-            all_slots = generate_time_slots(date, duration_minutes, timezone)
+            all_slots = generate_time_slots.function(date, duration_minutes, timezone)
             
-            available_slots = []
-            for slot_data in all_slots:
-                if 'error' in slot_data:
-                    continue
-                
-                # Check for conflicts
-                conflicts = find_calendar_conflicts(
-                    self.calendar_events,
-                    slot_data['start_time'],
-                    slot_data['end_time'],
-                    self.preferences.get('buffer_minutes', 15)
+            candidate_slots = [slot_data for slot_data in all_slots if 'error' not in slot_data]
+            
+            # Check every candidate against the whole calendar at once
+            conflicts = find_calendar_conflicts_batch(
+                self.calendar_events,
+                [(slot_data['start_time'], slot_data['end_time']) for slot_data in candidate_slots],
+                self.preferences.get('buffer_minutes', 15)
+            )
+            busy = conflicts.any(axis=1)
+            free_slots = [slot_data for slot_data, is_busy in zip(candidate_slots, busy) if not is_busy]
+            
+            # Score every conflict-free slot in one pass
+            pref_scores = calculate_preference_scores(
+                [slot_data['start_time'] for slot_data in free_slots],
+                self.preferences
+            )
+            available_slots = [
+                TimeSlot(
+                    start_time=slot_data['start_time'],
+                    end_time=slot_data['end_time'],
+                    duration_minutes=duration_minutes,
+                    participants=[self.email],
+                    preference_score=float(pref_score),
+                    time_display=slot_data['time_display']
                 )
-                
-                # If no conflicts, calculate preference score
-                if not conflicts:
-                    pref_score = calculate_preference_score(
-                        slot_data['start_time'],
-                        self.preferences
-                    )
-                    
-                    time_slot = TimeSlot(
-                        start_time=slot_data['start_time'],
-                        end_time=slot_data['end_time'],
-                        duration_minutes=duration_minutes,
-                        participants=[self.email],
-                        preference_score=pref_score,
-                        time_display=slot_data['time_display']
-                    )
-                    available_slots.append(time_slot)
+                for slot_data, pref_score in zip(free_slots, pref_scores)
+            ]
             
             # Sort by preference score
             available_slots.sort(key=lambda x: x.preference_score or 0, reverse=True)
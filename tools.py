@@ -1,72 +1,232 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import pytz
 import re
+import time
 from pydantic import Field
 from pydantic_ai import Tool
 from config import get_timezone_for_email, get_user_preferences
 from models import CalendarEvent, TimeSlot, UserPreferences
 
-@Tool
-def get_current_date() -> str:
-    """Return the current date and time with day of week for date calculations."""
-    now = datetime.now()
-    return f"{now.strftime('%A, %Y-%m-%d %H:%M:%S')} (Today is {now.strftime('%A')})"
+# Repeated per attendee, so resolve each zone / email domain once
+_tz = lru_cache(maxsize=64)(pytz.timezone)
+_timezone_for_email = lru_cache(maxsize=256)(get_timezone_for_email)
 
-@Tool  
-def calculate_next_date(day_name: str, reference_date: str = None) -> str:
-    """Calculate the next occurrence of a specific day (e.g., 'next Thursday', 'Monday').
+_WEEKDAY_IDX = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3, 'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+# One scan over every "<n> <unit>" / "<n>-<unit>" mention; the rank keeps the original pattern
+# priority (minutes, mins, hours, hrs, then "-minute", "-hour"), leftmost within a rank
+_DURATION_RE = re.compile(r'(\d+)(\s*|-)(minute|min|hour|hr)')
+_DURATION_RANKS = {
+    (False, 'minute'): 0,
+    (False, 'min'): 1,
+    (False, 'hour'): 2,
+    (False, 'hr'): 3,
+    (True, 'minute'): 4,
+    (True, 'hour'): 5,
+}
+
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(iso_str: str) -> datetime:
+    """Parse an ISO timestamp, reading a trailing 'Z' as UTC"""
+    if iso_str.endswith('Z'):
+        iso_str = iso_str[:-1] + '+00:00'
+    return datetime.fromisoformat(iso_str)
+
+@lru_cache(maxsize=64)
+def _event_bounds(raw_times: Tuple[Tuple[str, str], ...]) -> Tuple[np.ndarray, np.ndarray, bool, bool]:
+    """Epoch-second start/end arrays for (StartTime, EndTime) pairs, plus whether any were naive/aware"""
+    starts = np.empty(len(raw_times))
+    ends = np.empty(len(raw_times))
+    has_naive = has_aware = False
+    for i, (start_str, end_str) in enumerate(raw_times):
+        for bounds, raw in ((starts, start_str), (ends, end_str)):
+            dt = _parse_iso_utc(raw)
+            if dt.tzinfo is None:
+                # Naive times only compare among themselves, so read them as wall-clock UTC
+                has_naive = True
+                dt = dt.replace(tzinfo=timezone.utc)
+            else:
+                has_aware = True
+            bounds[i] = dt.timestamp()
+    # Shared between callers through the cache
+    starts.flags.writeable = ends.flags.writeable = False
+    return starts, ends, has_naive, has_aware
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Epoch seconds, reading naive datetimes as wall-clock UTC like _event_bounds"""
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+@lru_cache(maxsize=64)
+def _slot_grid(date: str, duration_minutes: int, timezone: str) -> Tuple[Tuple[str, str, str], ...]:
+    """(start ISO, end ISO, display) for each 15-minute slot within 9 AM - 6 PM on a date"""
+    tz = _tz(timezone)
+    date_obj = datetime.strptime(date, '%Y-%m-%d')
     
-    Args:
-        day_name: Name of the day (e.g., 'thursday', 'next friday')
-        reference_date: Reference date in YYYY-MM-DD format (defaults to today)
+    # Business hours: 9 AM to 6 PM
+    day_start = tz.localize(date_obj.replace(hour=9, minute=0))
     
-    Returns:
-        Date in YYYY-MM-DD format
-    """
-    if reference_date:
-        base_date = datetime.strptime(reference_date, '%Y-%m-%d')
-    else:
-        base_date = datetime.now()
+    if duration_minutes != int(duration_minutes):
+        # Fractional minutes need seconds in the end time; keep the datetime arithmetic
+        day_end = tz.localize(date_obj.replace(hour=18, minute=0))
+        duration = timedelta(minutes=duration_minutes)
+        grid = []
+        current_time = day_start
+        while current_time + duration <= day_end:
+            grid.append((
+                current_time.isoformat(),
+                (current_time + duration).isoformat(),
+                current_time.strftime('%H:%M %Z')
+            ))
+            current_time += timedelta(minutes=15)  # 15-minute increments
+        return tuple(grid)
     
-    day_name_lower = day_name.lower().strip()
+    # Every slot shares the 9 AM offset (pytz arithmetic never re-localizes), so only
+    # the clock time differs between slots and it can be formatted from minute counts
+    duration_minutes = int(duration_minutes)
+    day_prefix = day_start.strftime('%Y-%m-%dT')
+    offset = day_start.isoformat()[19:]
+    tz_label = day_start.strftime('%Z')
     
-    weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    grid = []
+    # Minutes after midnight for each slot start that still ends by 6 PM
+    for start_min in range(9 * 60, 18 * 60 - duration_minutes + 1, 15):
+        end_min = start_min + duration_minutes
+        clock = f"{start_min // 60:02d}:{start_min % 60:02d}"
+        grid.append((
+            f"{day_prefix}{clock}:00{offset}",
+            f"{day_prefix}{end_min // 60:02d}:{end_min % 60:02d}:00{offset}",
+            f"{clock} {tz_label}"
+        ))
+    return tuple(grid)
+
+@lru_cache(maxsize=16)
+def _hour_scores(morning: bool, afternoon: bool, evening: bool, avoid_lunch: bool) -> np.ndarray:
+    """Pre-seniority preference score for each hour of the day"""
+    scores = np.full(24, 0.5)  # Base score
+    # Preferred times (the ranges are disjoint, so at most one bonus applies)
+    if morning:
+        scores[9:12] += 0.3
+    if afternoon:
+        scores[13:17] += 0.3
+    if evening:
+        scores[17:20] += 0.2
+    # Avoid lunch time
+    if avoid_lunch:
+        scores[12:14] -= 0.4
+    scores.flags.writeable = False
+    return scores
+
+def _preference_table(user_preferences: Dict[str, Any]) -> Tuple[np.ndarray, float]:
+    """Hour score table and seniority factor for a preference dict"""
+    preferred_times = user_preferences.get('preferred_times', [])
+    table = _hour_scores(
+        'morning' in preferred_times,
+        'afternoon' in preferred_times,
+        'evening' in preferred_times,
+        bool(user_preferences.get('avoid_lunch', False))
+    )
+    # Seniority weight
+    seniority = user_preferences.get('seniority_weight', 0.5)
+    return table, 0.7 + 0.6 * seniority
+
+def calculate_preference_scores(start_times: List[str], user_preferences: Dict[str, Any]) -> np.ndarray:
+    """Preference scores for many slot start times at once (see calculate_preference_score)"""
+    try:
+        table, factor = _preference_table(user_preferences)
+        hours = np.fromiter((datetime.fromisoformat(start).hour for start in start_times), dtype=np.intp)
+        return np.clip(table[hours] * factor, 0.0, 1.0)
+    except:
+        return np.full(len(start_times), 0.5)
+
+@lru_cache(maxsize=1)
+def _current_date_text(epoch_second: int) -> str:
+    """Format the current date line for one wall-clock second"""
+    now = datetime.fromtimestamp(epoch_second)
+    return f"{now.strftime('%A, %Y-%m-%d %H:%M:%S')} (Today is {now.strftime('%A')})"
+
+@lru_cache(maxsize=256)
+def _date_ordinal(date_str: str) -> int:
+    """Ordinal of a YYYY-MM-DD date string"""
+    return datetime.strptime(date_str, '%Y-%m-%d').toordinal()
+
+@lru_cache(maxsize=512)
+def _next_date(day_name_lower: str, base_ordinal: int) -> str:
+    """Resolve a normalized day name against a reference date given as an ordinal"""
+    base_date = date.fromordinal(base_ordinal)
     
     # Handle "next [day]" explicitly
     if day_name_lower.startswith('next '):
         target_day_name = day_name_lower[5:]  # Remove "next "
-        if target_day_name in weekdays:
-            target_weekday = weekdays.index(target_day_name)
+        target_weekday = _WEEKDAY_IDX.get(target_day_name)
+        if target_weekday is not None:
             # For "next [day]", always go to next week's occurrence
             days_ahead = (target_weekday - base_date.weekday() + 7) % 7
             if days_ahead == 0:  # If today is the target day, go to next week
                 days_ahead = 7
             target_date = base_date + timedelta(days=days_ahead)
-            return target_date.strftime('%Y-%m-%d')
+            return target_date.isoformat()
     
     # Handle standalone day names
-    if day_name_lower in weekdays:
-        target_weekday = weekdays.index(day_name_lower)
+    target_weekday = _WEEKDAY_IDX.get(day_name_lower)
+    if target_weekday is not None:
         days_ahead = (target_weekday - base_date.weekday()) % 7
         if days_ahead == 0:  # If today is the target day, assume next week
             days_ahead = 7
         target_date = base_date + timedelta(days=days_ahead)
-        return target_date.strftime('%Y-%m-%d')
+        return target_date.isoformat()
     
     # Handle relative terms
     if 'tomorrow' in day_name_lower:
-        return (base_date + timedelta(days=1)).strftime('%Y-%m-%d')
+        return (base_date + timedelta(days=1)).isoformat()
     elif 'today' in day_name_lower:
-        return base_date.strftime('%Y-%m-%d')
+        return base_date.isoformat()
     elif 'next week' in day_name_lower:
-        return (base_date + timedelta(days=7)).strftime('%Y-%m-%d')
+        return (base_date + timedelta(days=7)).isoformat()
     
     # Default to next business day
     days_ahead = 1
     while (base_date + timedelta(days=days_ahead)).weekday() >= 5:  # Skip weekends
         days_ahead += 1
-    return (base_date + timedelta(days=days_ahead)).strftime('%Y-%m-%d')
+    return (base_date + timedelta(days=days_ahead)).isoformat()
+
+@lru_cache(maxsize=512)
+def _duration_minutes(text_lower: str) -> int:
+    """Read the highest-priority duration mention in lowercased text"""
+    best_rank, best = len(_DURATION_RANKS), None
+    for match in _DURATION_RE.finditer(text_lower):
+        rank = _DURATION_RANKS.get((match.group(2) == '-', match.group(3)), best_rank)
+        if rank < best_rank:
+            best_rank, best = rank, match
+    if best is not None:
+        duration = int(best.group(1))
+        return duration if best.group(3).startswith('min') else duration * 60
+    
+    return 30  # Default duration
+
+@Tool
+def get_current_date() -> str:
+    """Return the current date and time with day of week for date calculations."""
+    return _current_date_text(int(time.time()))
+
+@Tool  
+def calculate_next_date(day_name: str, reference_date: str = None) -> str:
+    """Calculate the next occurrence of a specific day (e.g., 'next Thursday', 'Monday').
+    
+    Args:
+        day_name: Name of the day (e.g., 'thursday', 'next friday')
+        reference_date: Reference date in YYYY-MM-DD format (defaults to today)
+    
+    Returns:
+        Date in YYYY-MM-DD format
+    """
+    # Only the calendar date of "now" matters, so today's ordinal is a stable cache key
+    base_ordinal = _date_ordinal(reference_date) if reference_date else date.today().toordinal()
+    return _next_date(day_name.lower().strip(), base_ordinal)
 
 @Tool
 def extract_duration_from_text(text: str) -> int:
@@ -78,28 +238,7 @@ def extract_duration_from_text(text: str) -> int:
     Returns:
         Duration in minutes
     """
-    text_lower = text.lower()
-    
-    patterns = [
-        r'(\d+)\s*minutes?',
-        r'(\d+)\s*mins?', 
-        r'(\d+)\s*hours?',
-        r'(\d+)\s*hrs?',
-        r'for\s+(\d+)\s*minutes?',
-        r'for\s+(\d+)\s*hours?',
-        r'(\d+)-minute',
-        r'(\d+)-hour'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            duration = int(match.group(1))
-            if 'hour' in pattern or 'hr' in pattern:
-                duration *= 60
-            return duration
-    
-    return 30  # Default duration
+    return _duration_minutes(text.lower())
 
 @Tool
 def get_user_timezone(email: str) -> str:
@@ -111,7 +250,7 @@ def get_user_timezone(email: str) -> str:
     Returns:
         Timezone string (e.g., 'America/New_York')
     """
-    return get_timezone_for_email(email)
+    return _timezone_for_email(email)
 
 @Tool
 def convert_time_across_timezones(iso_time: str, target_timezones: List[str]) -> Dict[str, str]:
@@ -127,11 +266,11 @@ def convert_time_across_timezones(iso_time: str, target_timezones: List[str]) ->
     try:
         dt = datetime.fromisoformat(iso_time)
         if dt.tzinfo is None:
-            dt = pytz.timezone('Asia/Kolkata').localize(dt)
+            dt = _tz('Asia/Kolkata').localize(dt)
         
         result = {}
         for tz_str in target_timezones:
-            tz = pytz.timezone(tz_str)
+            tz = _tz(tz_str)
             local_time = dt.astimezone(tz)
             result[tz_str] = local_time.strftime('%I:%M %p %Z')
         
@@ -153,9 +292,9 @@ def check_business_hours(iso_time: str, timezone: str) -> bool:
     try:
         dt = datetime.fromisoformat(iso_time)
         if dt.tzinfo is None:
-            dt = pytz.timezone('Asia/Kolkata').localize(dt)
+            dt = _tz('Asia/Kolkata').localize(dt)
         
-        tz = pytz.timezone(timezone)
+        tz = _tz(timezone)
         local_time = dt.astimezone(tz)
         
         # Check if weekday (Monday=0, Sunday=6)
@@ -189,23 +328,49 @@ def find_calendar_conflicts(events: List[Dict[str, Any]], start_time: str, end_t
         buffered_start = proposed_start - timedelta(minutes=buffer_minutes)
         buffered_end = proposed_end + timedelta(minutes=buffer_minutes)
         
-        conflicts = []
-        for event in events:
-            event_start = datetime.fromisoformat(event['StartTime'].replace('Z', '+00:00'))
-            event_end = datetime.fromisoformat(event['EndTime'].replace('Z', '+00:00'))
-            
-            # Check for overlap
-            if not (buffered_end <= event_start or buffered_start >= event_end):
-                conflicts.append({
-                    'event': event,
-                    'overlap_type': 'calendar_conflict',
-                    'buffer_minutes': buffer_minutes
-                })
+        starts, ends, has_naive, has_aware = _event_bounds(
+            tuple((event['StartTime'], event['EndTime']) for event in events)
+        )
+        if has_aware if proposed_start.tzinfo is None else has_naive:
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+        
+        # Overlap test for every event at once; only conflicting events are materialized
+        overlapping = (starts < _epoch_seconds(buffered_end)) & (ends > _epoch_seconds(buffered_start))
+        conflicts = [
+            {
+                'event': events[i],
+                'overlap_type': 'calendar_conflict',
+                'buffer_minutes': buffer_minutes
+            }
+            for i in np.flatnonzero(overlapping)
+        ]
         
         return conflicts
     except Exception as e:
         return [{'error': str(e)}]
 
+def find_calendar_conflicts_batch(events: List[Dict[str, Any]], proposed_slots: List[Tuple[str, str]], buffer_minutes: int = 15) -> np.ndarray:
+    """Conflict mask of shape (len(proposed_slots), len(events)) for many (start, end) slots at once (see find_calendar_conflicts)"""
+    starts, ends, has_naive, has_aware = _event_bounds(
+        tuple((event['StartTime'], event['EndTime']) for event in events)
+    )
+    
+    slot_starts = np.empty(len(proposed_slots))
+    slot_ends = np.empty(len(proposed_slots))
+    for i, (start_time, end_time) in enumerate(proposed_slots):
+        proposed_start = datetime.fromisoformat(start_time)
+        if has_aware if proposed_start.tzinfo is None else has_naive:
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+        slot_starts[i] = _epoch_seconds(proposed_start)
+        slot_ends[i] = _epoch_seconds(datetime.fromisoformat(end_time))
+    
+    # Every slot against every event in one broadcast overlap test
+    buffer_secs = buffer_minutes * 60
+    return (
+        (starts[None, :] < (slot_ends + buffer_secs)[:, None])
+        & (ends[None, :] > (slot_starts - buffer_secs)[:, None])
+    )
+
 @Tool
 def calculate_preference_score(start_time: str, user_preferences: Dict[str, Any]) -> float:
     """Calculate preference score for a time slot based on user preferences.
@@ -218,27 +383,8 @@ def calculate_preference_score(start_time: str, user_preferences: Dict[str, Any]
         Preference score between 0.0 and 1.0
     """
     try:
-        dt = datetime.fromisoformat(start_time)
-        hour = dt.hour
-        
-        score = 0.5  # Base score
-        
-        # Preferred times
-        preferred_times = user_preferences.get('preferred_times', [])
-        if 'morning' in preferred_times and 9 <= hour < 12:
-            score += 0.3
-        elif 'afternoon' in preferred_times and 13 <= hour < 17:
-            score += 0.3
-        elif 'evening' in preferred_times and 17 <= hour < 20:
-            score += 0.2
-        
-        # Avoid lunch time
-        if user_preferences.get('avoid_lunch', False) and 12 <= hour < 14:
-            score -= 0.4
-        
-        # Seniority weight
-        seniority = user_preferences.get('seniority_weight', 0.5)
-        score = score * (0.7 + 0.6 * seniority)
+        table, factor = _preference_table(user_preferences)
+        score = float(table[datetime.fromisoformat(start_time).hour]) * factor
         
         return max(0.0, min(1.0, score))
     except:
@@ -257,28 +403,14 @@ def generate_time_slots(date: str, duration_minutes: int, timezone: str = 'Asia/
         List of time slot dictionaries
     """
     try:
-        tz = pytz.timezone(timezone)
-        date_obj = datetime.strptime(date, '%Y-%m-%d')
-        
-        # Business hours: 9 AM to 6 PM
-        start_time = tz.localize(date_obj.replace(hour=9, minute=0))
-        end_time = tz.localize(date_obj.replace(hour=18, minute=0))
-        
-        slots = []
-        current_time = start_time
-        
-        while current_time + timedelta(minutes=duration_minutes) <= end_time:
-            slot_end = current_time + timedelta(minutes=duration_minutes)
-            
-            slots.append({
-                'start_time': current_time.isoformat(),
-                'end_time': slot_end.isoformat(),
+        return [
+            {
+                'start_time': start,
+                'end_time': end,
                 'duration_minutes': duration_minutes,
-                'time_display': current_time.strftime('%H:%M %Z')
-            })
-            
-            current_time += timedelta(minutes=15)  # 15-minute increments
-        
-        return slots
+                'time_display': display
+            }
+            for start, end, display in _slot_grid(date, duration_minutes, timezone)
+        ]
     except Exception as e:
         return [{'error': str(e)}]
\ No newline at end of file